@@ -1,9 +1,16 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.forms.models import BaseInlineFormSet
 from django.utils.translation import gettext_lazy as _
 from .models import User, Team, TeamMembership, AuditLog
 
 
+def is_changelist_request(request):
+    """True when the admin is rendering a changelist (not a change form)"""
+    match = request.resolver_match
+    return match is not None and match.url_name.endswith('_changelist')
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = ['email', 'name', 'role', 'is_active', 'date_joined']
@@ -29,23 +36,58 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            # Only load the columns rendered in list_display
+            queryset = queryset.only('id', 'email', 'name', 'role', 'is_active', 'date_joined')
+        return queryset
+
+
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    """Inline formset that only renders one page of the related rows"""
+    per_page = 50
+    page = 1
+
+    def get_queryset(self):
+        if not hasattr(self, '_queryset'):
+            queryset = super().get_queryset()
+            start = (self.page - 1) * self.per_page
+            self._queryset = queryset[start:start + self.per_page]
+        return self._queryset
+
 
 class TeamMembershipInline(admin.TabularInline):
-    """Team membership inline admin"""
+    """Team membership inline admin (paginated via ?mempage=N)"""
     model = TeamMembership
+    formset = PaginatedInlineFormSet
     extra = 1
     fields = ['user', 'role', 'joined_at']
     readonly_fields = ['joined_at']
+    autocomplete_fields = ['user']
+    per_page = 50
+    page_param = 'mempage'
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        formset.per_page = self.per_page
+        try:
+            formset.page = max(int(request.GET.get(self.page_param, 1)), 1)
+        except ValueError:
+            formset.page = 1
+        return formset
 
 
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
     """Team admin"""
     list_display = ['name', 'leader', 'get_member_count', 'created_at']
+    list_select_related = ['leader']
     list_filter = ['created_at']
     search_fields = ['name', 'description']
     ordering = ['-created_at']
     readonly_fields = ['created_at', 'updated_at']
+    autocomplete_fields = ['leader']
     inlines = [TeamMembershipInline]
     
     fieldsets = (
@@ -53,19 +95,28 @@ class TeamAdmin(admin.ModelAdmin):
         (_('Timestamps'), {'fields': ('created_at', 'updated_at')}),
     )
     
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            queryset = queryset.defer('description')
+        return queryset
+    
     def get_member_count(self, obj):
         return obj.member_count
     get_member_count.short_description = 'Members'
+    get_member_count.admin_order_field = 'member_count'
 
 
 @admin.register(TeamMembership)
 class TeamMembershipAdmin(admin.ModelAdmin):
     """Team membership admin"""
     list_display = ['team', 'user', 'role', 'joined_at']
+    list_select_related = ['team', 'user']
     list_filter = ['role', 'joined_at']
     search_fields = ['team__name', 'user__email', 'user__name']
     ordering = ['-joined_at']
     readonly_fields = ['joined_at']
+    autocomplete_fields = ['team', 'user']
 
 
 @admin.register(AuditLog)
@@ -77,6 +128,12 @@ class AuditLogAdmin(admin.ModelAdmin):
     ordering = ['-timestamp']
     readonly_fields = ['user', 'user_email', 'action', 'details', 'ip_address', 'timestamp']
     
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            queryset = queryset.defer('details')
+        return queryset
+    
     def has_add_permission(self, request):
         """禁止手动添加审计日志"""
         return False
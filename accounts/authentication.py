@@ -0,0 +1,50 @@
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+
+# request.user 在请求中实际用到的列（权限判断、/auth/me、通知计数、kb 作者名等）
+REQUEST_USER_FIELDS = (
+    'id', 'email', 'username', 'first_name', 'last_name', 'name', 'role',
+    'avatar_url', 'department', 'phone',
+    'is_active', 'is_staff', 'is_superuser', 'date_joined', 'updated_at',
+    'unread_notification_count',
+)
+
+
+class LightweightJWTAuthentication(JWTAuthentication):
+    """
+    JWT 认证：只加载 request.user 需要的列
+    密码哈希、last_login 等请求中不使用的列不再随每个请求读取
+    """
+
+    def get_user(self, validated_token):
+        # 开启 token 吊销检查时需要比对密码哈希，走默认的整行加载
+        if getattr(api_settings, 'CHECK_REVOKE_TOKEN', False):
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        try:
+            user = User.objects.only(*REQUEST_USER_FIELDS).get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except User.DoesNotExist:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        return user
+
+
+class LightweightJWTScheme(SimpleJWTScheme):
+    """OpenAPI: document LightweightJWTAuthentication like the stock JWT scheme"""
+    target_class = 'accounts.authentication.LightweightJWTAuthentication'
@@ -2,39 +2,66 @@
 自定义异常处理器
 用于统一错误响应格式
 """
-from rest_framework.views import exception_handler
+from itertools import chain
+
+from rest_framework.views import exception_handler, set_rollback
 from rest_framework import status
+from rest_framework.exceptions import (
+    NotAuthenticated,
+    PermissionDenied,
+    NotFound,
+    MethodNotAllowed,
+)
 from .response_wrapper import APIResponse
 
 
+# 常见异常的 detail 总是单个字符串，可以跳过 DRF 默认处理和字典解析
+_FAST_PATH_EXCEPTIONS = frozenset({
+    NotAuthenticated,
+    PermissionDenied,
+    NotFound,
+    MethodNotAllowed,
+})
+
+
 def custom_exception_handler(exc, context):
     """
     自定义异常处理器，返回统一的错误格式
     """
+    if type(exc) in _FAST_PATH_EXCEPTIONS:
+        set_rollback()
+        # status_code 可能已被 APIView.handle_exception 调整（401 -> 403）
+        response = APIResponse(
+            data=None,
+            message=exc.detail,
+            code=exc.status_code,
+            status_code=exc.status_code
+        )
+        auth_header = getattr(exc, 'auth_header', None)
+        if auth_header:
+            response['WWW-Authenticate'] = auth_header
+        return response
+    
     # 调用 DRF 默认的异常处理器
     response = exception_handler(exc, context)
     
     if response is not None:
         # 根据状态码设置错误消息
         status_code = response.status_code
+        data = response.data
         
         # 获取错误详情
-        if isinstance(response.data, dict):
-            if 'detail' in response.data:
-                message = response.data['detail']
-            elif 'error' in response.data:
-                message = response.data['error']
-            else:
+        if isinstance(data, dict):
+            message = data.get('detail') or data.get('error')
+            if not message:
                 # 如果有多个字段错误，合并它们
-                errors = []
-                for field, error_list in response.data.items():
-                    if isinstance(error_list, list):
-                        errors.extend(error_list)
-                    else:
-                        errors.append(str(error_list))
+                errors = list(chain.from_iterable(
+                    value if isinstance(value, list) else [str(value)]
+                    for value in data.values()
+                ))
                 message = '; '.join(errors) if errors else 'Validation error'
         else:
-            message = str(response.data)
+            message = str(data)
         
         # 返回统一格式的错误响应
         return APIResponse(
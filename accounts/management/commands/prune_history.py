@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import AuditLog, Notification
+
+
+class Command(BaseCommand):
+    help = 'Delete old read notifications (and optionally old audit logs) in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--notification-days', type=int, default=90,
+            help='Delete read notifications older than this many days (default: 90)',
+        )
+        parser.add_argument(
+            '--audit-days', type=int, default=None,
+            help='Delete audit logs older than this many days (default: keep all)',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help='Rows deleted per DELETE statement (default: 5000)',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        batch_size = options['batch_size']
+
+        notifications = Notification.objects.filter(
+            is_read=True,
+            created_at__lt=now - timedelta(days=options['notification_days']),
+        )
+        deleted = self._delete_in_batches(notifications, batch_size)
+        self.stdout.write(f'Deleted {deleted} notifications')
+
+        if options['audit_days'] is not None:
+            audit_logs = AuditLog.objects.filter(
+                timestamp__lt=now - timedelta(days=options['audit_days']),
+            )
+            deleted = self._delete_in_batches(audit_logs, batch_size)
+            self.stdout.write(f'Deleted {deleted} audit logs')
+
+        self.stdout.write(self.style.SUCCESS('Pruning finished'))
+
+    def _delete_in_batches(self, queryset, batch_size):
+        """Delete matching rows in short transactions to avoid long table locks"""
+        total = 0
+        while True:
+            ids = list(queryset.values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return total
+            deleted, _ = queryset.model.objects.filter(pk__in=ids).delete()
+            total += deleted
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from accounts.models import Team, TeamMembership
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored Team.member_count from team memberships'
+
+    def handle(self, *args, **options):
+        counts = (
+            TeamMembership.objects.filter(team=OuterRef('pk'))
+            .values('team')
+            .annotate(c=Count('*'))
+            .values('c')
+        )
+        updated = Team.objects.update(
+            member_count=Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+        )
+        self.stdout.write(self.style.SUCCESS(f'Synced member counts for {updated} teams'))
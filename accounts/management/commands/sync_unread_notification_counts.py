@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from accounts.models import Notification, User
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored User.unread_notification_count from notifications'
+
+    def handle(self, *args, **options):
+        counts = (
+            Notification.objects.filter(recipient=OuterRef('pk'), is_read=False)
+            .values('recipient')
+            .annotate(c=Count('*'))
+            .values('c')
+        )
+        updated = User.objects.update(
+            unread_notification_count=Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+        )
+        self.stdout.write(self.style.SUCCESS(f'Synced unread notification counts for {updated} users'))
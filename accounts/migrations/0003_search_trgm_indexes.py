@@ -0,0 +1,45 @@
+# Generated migration for admin search trigram indexes
+
+from django.db import migrations
+
+
+# Admin icontains search compiles to UPPER(col) LIKE UPPER('%q%') on PostgreSQL,
+# so the trigram indexes are built on the same UPPER() expression.
+TRGM_INDEXES = [
+    ('users_email_trgm', 'users', 'email'),
+    ('users_name_trgm', 'users', 'name'),
+    ('users_username_trgm', 'users', 'username'),
+    ('audit_logs_user_email_trgm', 'audit_logs', 'user_email'),
+    ('audit_logs_action_trgm', 'audit_logs', 'action'),
+]
+
+
+def create_trgm_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRGM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    """Drop pg_trgm GIN indexes (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_notificationpreference_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
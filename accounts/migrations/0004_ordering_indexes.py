@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['-updated_at'], name='teams_updated_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammembership',
+            index=models.Index(fields=['-joined_at'], name='tm_joined_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-date_joined'], name='users_joined_desc_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='teammembership',
+            index=models.Index(fields=['team', 'role'], name='tm_team_role_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_teammembership_team_role_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['recipient', '-created_at'], name='notif_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:28
+
+from django.db import migrations, models
+
+
+def backfill_recipient_email(apps, schema_editor):
+    """Copy recipient email onto existing notifications"""
+    Notification = apps.get_model('accounts', 'Notification')
+    User = apps.get_model('accounts', 'User')
+    Notification.objects.update(
+        recipient_email=models.Subquery(
+            User.objects.filter(pk=models.OuterRef('recipient_id')).values('email')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_notification_unread_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='recipient_email',
+            field=models.EmailField(blank=True, default='', max_length=255, verbose_name='Recipient Email'),
+        ),
+        migrations.RunPython(backfill_recipient_email, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_notification_recipient_email'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='audit_logs_timesta_e93820_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['-timestamp'], include=('user_email', 'action', 'ip_address'), name='auditlog_tsdesc_cover'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:30
+
+from django.db import migrations, models
+
+
+def demote_extra_leaders(apps, schema_editor):
+    """Keep a single leader membership per team before adding the constraint"""
+    Team = apps.get_model('accounts', 'Team')
+    TeamMembership = apps.get_model('accounts', 'TeamMembership')
+    duplicated = (
+        TeamMembership.objects.filter(role='leader')
+        .values('team_id')
+        .annotate(n=models.Count('id'))
+        .filter(n__gt=1)
+        .values_list('team_id', flat=True)
+    )
+    for team in Team.objects.filter(id__in=list(duplicated)):
+        leaders = TeamMembership.objects.filter(team=team, role='leader').order_by('-joined_at')
+        keep = leaders.filter(user_id=team.leader_id).first() or leaders.first()
+        leaders.exclude(pk=keep.pk).update(role='member')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_auditlog_timestamp_covering_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(demote_extra_leaders, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='teammembership',
+            constraint=models.UniqueConstraint(condition=models.Q(('role', 'leader')), fields=('team',), name='one_leader_per_team'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:32
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_member_count(apps, schema_editor):
+    """Populate member_count from existing memberships"""
+    Team = apps.get_model('accounts', 'Team')
+    TeamMembership = apps.get_model('accounts', 'TeamMembership')
+    counts = (
+        TeamMembership.objects.filter(team=models.OuterRef('pk'))
+        .values('team')
+        .annotate(c=models.Count('*'))
+        .values('c')
+    )
+    Team.objects.update(
+        member_count=Coalesce(models.Subquery(counts, output_field=models.IntegerField()), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_one_leader_per_team'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Member Count'),
+        ),
+        migrations.RunPython(backfill_member_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:33
+
+import accounts.models
+from django.db import migrations, models
+import django.db.models.functions.text
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    """Normalize stored emails to lowercase before adding the case-insensitive constraint"""
+    User = apps.get_model('accounts', 'User')
+    clashes = list(
+        User.objects.annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    if clashes:
+        raise RuntimeError(
+            'Users whose emails differ only by case must be merged first: '
+            + ', '.join(clashes)
+        )
+    User.objects.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_team_member_count'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', accounts.models.UserManager()),
+            ],
+        ),
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('email'), name='users_email_upper_uniq'),
+        ),
+    ]
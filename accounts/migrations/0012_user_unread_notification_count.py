@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:47
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_unread_notification_count(apps, schema_editor):
+    """Populate unread_notification_count from existing notifications"""
+    User = apps.get_model('accounts', 'User')
+    Notification = apps.get_model('accounts', 'Notification')
+    counts = (
+        Notification.objects.filter(recipient=models.OuterRef('pk'), is_read=False)
+        .values('recipient')
+        .annotate(c=models.Count('*'))
+        .values('c')
+    )
+    User.objects.update(
+        unread_notification_count=Coalesce(models.Subquery(counts, output_field=models.IntegerField()), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_user_email_case_insensitive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='unread_notification_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Unread Notifications'),
+        ),
+        migrations.RunPython(backfill_unread_notification_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_user_unread_notification_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='audit_logs_user_id_73c422_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='audit_logs_action_31f574_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notificatio_recipie_583549_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['user', '-timestamp'], name='auditlog_user_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['action', '-timestamp'], name='auditlog_action_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'is_read', '-created_at'], name='notif_recip_read_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'type', '-created_at'], name='notif_recip_type_created_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated migration: build the AuditLog covering index on PostgreSQL only
+
+from django.db import migrations, models
+
+
+# Index.include is PostgreSQL-only (models.W040 on other backends), so the model
+# declares a plain index and the INCLUDE columns are added here by vendor.
+INCLUDE_COLUMNS = ('user_email', 'action', 'ip_address')
+
+
+def create_timestamp_index(apps, schema_editor):
+    """Create the newest-first timestamp index (covering on PostgreSQL)"""
+    include = ''
+    if schema_editor.connection.vendor == 'postgresql':
+        include = f' INCLUDE ({", ".join(INCLUDE_COLUMNS)})'
+    schema_editor.execute(
+        f'CREATE INDEX auditlog_tsdesc_idx ON audit_logs ("timestamp" DESC){include}'
+    )
+
+
+def drop_timestamp_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX IF EXISTS auditlog_tsdesc_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_auditlog_notification_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='auditlog_tsdesc_cover',
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='auditlog',
+                    index=models.Index(fields=['-timestamp'], name='auditlog_tsdesc_idx'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_timestamp_index, drop_timestamp_index),
+            ],
+        ),
+    ]
@@ -1,8 +1,22 @@
-from django.contrib.auth.models import AbstractUser
+from collections import Counter, defaultdict
+
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Greatest, Upper
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
+class UserManager(BaseUserManager):
+    """User manager with case-insensitive email lookup for authentication"""
+
+    def get_by_natural_key(self, username):
+        # Served by the users_email_upper_uniq functional index
+        return self.get(email__iexact=username)
+
+
 class User(AbstractUser):
     """Custom User Model"""
 
@@ -37,18 +51,29 @@ class User(AbstractUser):
     # We only need to add updated_at
     updated_at = models.DateTimeField('Updated At', auto_now=True)
 
+    # === Denormalized Counters ===
+    # Maintained by Notification with F() updates (see adjust_unread_notification_count)
+    unread_notification_count = models.PositiveIntegerField('Unread Notifications', default=0)
+
     # === Authentication Configuration ===
     USERNAME_FIELD = 'email'
     # Required fields (besides email and password) that createsuperuser command will ask for
     # Note: AbstractUser requires username by default, so we include it here
     REQUIRED_FIELDS = ['username', 'name']
 
+    objects = UserManager()
+
     class Meta:
         db_table = 'users'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
         indexes = [
             models.Index(fields=['role']),
+            models.Index(fields=['-date_joined'], name='users_joined_desc_idx'),
+        ]
+        constraints = [
+            # Case-insensitive uniqueness; matches the UPPER() form Django uses for iexact
+            models.UniqueConstraint(Upper('email'), name='users_email_upper_uniq'),
         ]
         # Order by creation time (newest first)
         ordering = ['-date_joined']
@@ -56,25 +81,61 @@ class User(AbstractUser):
     def __str__(self):
         return f"{self.name} ({self.email})" if self.name else self.email
 
+    # Cached role predicates, cleared on save so a role change is picked up
+    _ROLE_PREDICATES = ('is_admin', 'is_manager', 'is_support_staff', 'is_end_user')
+
     def save(self, *args, **kwargs):
-        if self.username is None or self.username == "":
+        if self.email:
+            self.email = self.email.lower()
+        if not self.username:
             self.username = self.email
+        # Django saves instances with deferred columns (e.g. request.user loaded
+        # by LightweightJWTAuthentication) with update_fields set to the loaded
+        # columns; build that list here so it leaves the counter out as well.
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            deferred = self.get_deferred_fields()
+            if deferred:
+                kwargs['update_fields'] = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.name != 'unread_notification_count'
+                    and field.attname not in deferred
+                ]
         super().save(*args, **kwargs)
+        for attr in self._ROLE_PREDICATES:
+            self.__dict__.pop(attr, None)
 
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # unread_notification_count is maintained with F() updates; a plain save()
+        # never writes a possibly stale in-memory value back. Filtering the UPDATE
+        # (instead of forcing update_fields) keeps the fallback to INSERT when the
+        # row no longer exists.
+        if update_fields is None:
+            values = [value for value in values if value[0].name != 'unread_notification_count']
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
 
-    @property
+    @classmethod
+    def adjust_unread_notification_count(cls, user_ids, delta):
+        """Add delta to the stored unread counter of the given users (never below zero)"""
+        if delta:
+            cls.objects.filter(pk__in=user_ids).update(
+                unread_notification_count=Greatest(F('unread_notification_count') + delta, 0)
+            )
+
+
+    @cached_property
     def is_admin(self):
         return self.role == self.Role.ADMIN
     
-    @property
+    @cached_property
     def is_manager(self):
         return self.role == self.Role.MANAGER
 
-    @property
+    @cached_property
     def is_support_staff(self):
         return self.role == self.Role.SUPPORT_STAFF
 
-    @property
+    @cached_property
     def is_end_user(self):
         return self.role == self.Role.END_USER
 
@@ -91,6 +152,8 @@ class Team(models.Model):
         related_name='led_teams',
         verbose_name='Team Leader'
     )
+    # Count of team members including leader, kept in sync by accounts.signals
+    member_count = models.PositiveIntegerField('Member Count', default=0)
     created_at = models.DateTimeField('Created At', auto_now_add=True)
     updated_at = models.DateTimeField('Updated At', auto_now=True)
     
@@ -99,14 +162,20 @@ class Team(models.Model):
         verbose_name = 'Team'
         verbose_name_plural = 'Teams'
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['-updated_at'], name='teams_updated_desc_idx'),
+        ]
     
     def __str__(self):
         return self.name
     
-    @property
-    def member_count(self):
-        """Count of team members including leader"""
-        return self.memberships.count()
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # member_count is maintained with F() updates by the TeamMembership
+        # signals; a plain save() never writes a possibly stale in-memory value
+        # back. A deleted row is still re-inserted as with any model.
+        if update_fields is None:
+            values = [value for value in values if value[0].name != 'member_count']
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
     
     @property
     def active_tickets(self):
@@ -148,6 +217,17 @@ class TeamMembership(models.Model):
         verbose_name_plural = 'Team Memberships'
         unique_together = ['team', 'user']
         ordering = ['-joined_at']
+        indexes = [
+            models.Index(fields=['-joined_at'], name='tm_joined_desc_idx'),
+            models.Index(fields=['team', 'role'], name='tm_team_role_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['team'],
+                condition=Q(role='leader'),
+                name='one_leader_per_team',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.user.email} in {self.team.name} ({self.role})"
@@ -175,9 +255,12 @@ class AuditLog(models.Model):
         verbose_name_plural = 'Audit Logs'
         ordering = ['-timestamp']
         indexes = [
-            models.Index(fields=['-timestamp']),
-            models.Index(fields=['user']),
-            models.Index(fields=['action']),
+            # Newest-first changelist order. On PostgreSQL migration 0014 builds it as a
+            # covering index (INCLUDE user_email, action, ip_address) for index-only scans
+            models.Index(fields=['-timestamp'], name='auditlog_tsdesc_idx'),
+            # 按用户 / 操作类型筛选后按时间倒序分页，直接走索引顺序，无需排序
+            models.Index(fields=['user', '-timestamp'], name='auditlog_user_ts_idx'),
+            models.Index(fields=['action', '-timestamp'], name='auditlog_action_ts_idx'),
         ]
     
     def __str__(self):
@@ -203,6 +286,8 @@ class Notification(models.Model):
         related_name='notifications',
         verbose_name='Recipient'
     )
+    # Denormalized from recipient so __str__ / listings don't need the FK row
+    recipient_email = models.EmailField('Recipient Email', max_length=255, blank=True, default='')
     type = models.CharField(
         'Type',
         max_length=30,
@@ -234,20 +319,105 @@ class Notification(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['recipient', '-created_at']),
-            models.Index(fields=['recipient', 'is_read']),
+            # 通知列表的 isRead / type 筛选，按 created_at 倒序分页
+            models.Index(fields=['recipient', 'is_read', '-created_at'], name='notif_recip_read_created_idx'),
+            models.Index(fields=['recipient', 'type', '-created_at'], name='notif_recip_type_created_idx'),
             models.Index(fields=['type']),
+            # Partial index for the unread (bell icon) query; only unread rows are stored
+            models.Index(
+                fields=['recipient', '-created_at'],
+                name='notif_unread_idx',
+                condition=Q(is_read=False),
+            ),
         ]
     
     def __str__(self):
-        return f"{self.recipient.email} - {self.title}"
+        return f"{self.recipient_email} - {self.title}"
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Persisted read state, used to keep User.unread_notification_count in step
+        # (None when is_read was deferred, so loading it does not cost a query here)
+        self._saved_is_read = self.__dict__.get('is_read')
+    
+    def _persisted_is_read(self):
+        if self._saved_is_read is None and not self._state.adding:
+            self._saved_is_read = type(self).objects.filter(pk=self.pk).values_list('is_read', flat=True).first()
+        return bool(self._saved_is_read)
+    
+    def save(self, *args, **kwargs):
+        if not self.recipient_email and self.recipient_id:
+            self.recipient_email = self.recipient.email
+        adding = self._state.adding
+        update_fields = kwargs.get('update_fields')
+        writes_is_read = update_fields is None or 'is_read' in update_fields
+        was_read = self._persisted_is_read() if not adding and writes_is_read else None
+        super().save(*args, **kwargs)
+        
+        if adding:
+            delta = 0 if self.is_read else 1
+        elif writes_is_read:
+            delta = int(was_read) - int(self.is_read)
+        else:
+            return
+        self._saved_is_read = self.is_read
+        User.adjust_unread_notification_count([self.recipient_id], delta)
+    
+    def delete(self, *args, **kwargs):
+        was_read = self._persisted_is_read()
+        result = super().delete(*args, **kwargs)
+        if not was_read:
+            User.adjust_unread_notification_count([self.recipient_id], -1)
+        return result
+    
+    @classmethod
+    def bulk_notify(cls, recipients, *, notification_type, title, message,
+                    related_object_type=None, related_object_id=None, batch_size=1000):
+        """Create the same notification for many recipients with batched INSERTs"""
+        notifications = [
+            cls(
+                recipient=recipient,
+                recipient_email=recipient.email,
+                type=notification_type,
+                title=title,
+                message=message,
+                related_object_type=related_object_type,
+                related_object_id=related_object_id,
+            )
+            for recipient in recipients
+        ]
+        notifications = cls.objects.bulk_create(notifications, batch_size=batch_size)
+        
+        # bulk_create skips save(); bump unread counters, grouping recipients by how many rows they got
+        per_recipient = Counter(notification.recipient_id for notification in notifications)
+        by_delta = defaultdict(list)
+        for recipient_id, created in per_recipient.items():
+            by_delta[created].append(recipient_id)
+        for delta, recipient_ids in by_delta.items():
+            User.adjust_unread_notification_count(recipient_ids, delta)
+        return notifications
     
     def mark_as_read(self):
         """Mark notification as read"""
         if not self.is_read:
-            from django.utils import timezone
             self.is_read = True
             self.read_at = timezone.now()
-            self.save(update_fields=['is_read', 'read_at'])
+            # The is_read guard makes repeated calls a no-op UPDATE
+            updated = type(self).objects.filter(pk=self.pk, is_read=False).update(
+                is_read=True, read_at=self.read_at
+            )
+            self._saved_is_read = True
+            User.adjust_unread_notification_count([self.recipient_id], -updated)
+    
+    @classmethod
+    def mark_many_as_read(cls, recipient, ids=None, read_at=None):
+        """Mark a recipient's unread notifications (optionally limited to ids) as read in one UPDATE"""
+        queryset = cls.objects.filter(recipient=recipient, is_read=False)
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        updated = queryset.update(is_read=True, read_at=read_at or timezone.now())
+        User.adjust_unread_notification_count([recipient.pk], -updated)
+        return updated
 
 
 class NotificationPreference(models.Model):
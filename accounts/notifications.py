@@ -4,58 +4,142 @@ Handles creating and sending notifications (in-app and email)
 """
 
 import logging
-from typing import Optional, List
+from itertools import islice
+from typing import Iterable, Optional, List
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
+from django.db.models import Q, QuerySet
 from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from django.utils.html import escape
 from django.utils import timezone
 
 from .models import User, Notification, NotificationPreference
+from .tasks import run_async, run_later
 
 logger = logging.getLogger(__name__)
 
 
+# Notification type -> NotificationPreference field controlling it
+EMAIL_PREFERENCE_FIELDS = {
+    'ticket_created': 'email_ticket_created',
+    'ticket_assigned': 'email_ticket_assigned',
+    'ticket_status_changed': 'email_ticket_status_changed',
+    'ticket_comment': 'email_ticket_comment',
+    'sla_warning': 'email_sla_warning',
+    'sla_breached': 'email_sla_warning',
+    'system': 'email_system',
+    'mention': 'email_ticket_comment',
+}
+
+INAPP_PREFERENCE_FIELDS = {
+    'ticket_created': 'inapp_ticket_created',
+    'ticket_assigned': 'inapp_ticket_assigned',
+    'ticket_status_changed': 'inapp_ticket_status_changed',
+    'ticket_comment': 'inapp_ticket_comment',
+    'sla_warning': 'inapp_sla_warning',
+    'sla_breached': 'inapp_sla_warning',
+    'system': 'inapp_system',
+    'mention': 'inapp_ticket_comment',
+}
+
+PREFERENCE_FIELDS = sorted(set(EMAIL_PREFERENCE_FIELDS.values()) | set(INAPP_PREFERENCE_FIELDS.values()))
+
+# Flags used for users who have never saved their preferences
+DEFAULT_PREFERENCES = {
+    field: NotificationPreference._meta.get_field(field).default
+    for field in PREFERENCE_FIELDS
+}
+
+PREFERENCE_CACHE_TIMEOUT = 60 * 60
+
+
+def preference_cache_key(user_id) -> str:
+    return f'notifpref:{user_id}'
+
+
+def _preference_flags(prefs: NotificationPreference) -> dict:
+    return {field: getattr(prefs, field) for field in PREFERENCE_FIELDS}
+
+
 def get_or_create_preferences(user: User) -> NotificationPreference:
     """Get or create notification preferences for a user"""
     prefs, created = NotificationPreference.objects.get_or_create(user=user)
     return prefs
 
 
-def should_send_email(user: User, notification_type: str) -> bool:
-    """Check if email should be sent for this notification type"""
-    prefs = get_or_create_preferences(user)
-    
-    type_mapping = {
-        'ticket_created': prefs.email_ticket_created,
-        'ticket_assigned': prefs.email_ticket_assigned,
-        'ticket_status_changed': prefs.email_ticket_status_changed,
-        'ticket_comment': prefs.email_ticket_comment,
-        'sla_warning': prefs.email_sla_warning,
-        'sla_breached': prefs.email_sla_warning,
-        'system': prefs.email_system,
-        'mention': prefs.email_ticket_comment,
+def get_cached_preferences(user: User) -> dict:
+    """Get a user's preference flags from the cache, loading them on a miss"""
+    return cache.get_or_set(
+        preference_cache_key(user.id),
+        lambda: _preference_flags(get_or_create_preferences(user)),
+        PREFERENCE_CACHE_TIMEOUT,
+    )
+
+
+def get_preferences_map(users) -> dict:
+    """
+    Get preference flags for many users, keyed by user id
+
+    Cached entries are read with one get_many; the rest come from one query.
+    Users without a saved preference row get DEFAULT_PREFERENCES.
+    """
+    user_ids = [user.id for user in users]
+    cached = cache.get_many([preference_cache_key(user_id) for user_id in user_ids])
+    prefs_map = {
+        user_id: cached[preference_cache_key(user_id)]
+        for user_id in user_ids
+        if preference_cache_key(user_id) in cached
     }
     
-    return type_mapping.get(notification_type, False)
+    missing_ids = [user_id for user_id in user_ids if user_id not in prefs_map]
+    if missing_ids:
+        saved = {
+            prefs.user_id: _preference_flags(prefs)
+            for prefs in NotificationPreference.objects.filter(user_id__in=missing_ids)
+        }
+        # Defaults are cached too; creating the row later invalidates the entry
+        loaded = {user_id: saved.get(user_id, DEFAULT_PREFERENCES) for user_id in missing_ids}
+        cache.set_many(
+            {preference_cache_key(user_id): flags for user_id, flags in loaded.items()},
+            PREFERENCE_CACHE_TIMEOUT,
+        )
+        prefs_map.update(loaded)
+    
+    return prefs_map
 
 
-def should_send_inapp(user: User, notification_type: str) -> bool:
+def should_send_email(
+    user: User,
+    notification_type: str,
+    prefs: Optional[dict] = None
+) -> bool:
+    """Check if email should be sent for this notification type"""
+    field = EMAIL_PREFERENCE_FIELDS.get(notification_type)
+    if field is None:
+        return False
+    if prefs is None:
+        prefs = get_cached_preferences(user)
+    return prefs[field]
+
+
+def should_send_inapp(
+    user: User,
+    notification_type: str,
+    prefs: Optional[dict] = None
+) -> bool:
     """Check if in-app notification should be created"""
-    prefs = get_or_create_preferences(user)
-    
-    type_mapping = {
-        'ticket_created': prefs.inapp_ticket_created,
-        'ticket_assigned': prefs.inapp_ticket_assigned,
-        'ticket_status_changed': prefs.inapp_ticket_status_changed,
-        'ticket_comment': prefs.inapp_ticket_comment,
-        'sla_warning': prefs.inapp_sla_warning,
-        'sla_breached': prefs.inapp_sla_warning,
-        'system': prefs.inapp_system,
-        'mention': prefs.inapp_ticket_comment,
-    }
-    
-    return type_mapping.get(notification_type, True)
+    field = INAPP_PREFERENCE_FIELDS.get(notification_type)
+    if field is None:
+        return True
+    if prefs is None:
+        prefs = get_cached_preferences(user)
+    return prefs[field]
+
+
+def _html_body(message: str) -> str:
+    """Wrap a plain-text message in the default HTML email body"""
+    return f"<html><body><p>{escape(message)}</p></body></html>"
 
 
 def send_notification_email(
@@ -70,20 +154,20 @@ def send_notification_email(
             logger.warning(f"User {recipient.id} has no email address")
             return False
         
-        # Use plain text if no HTML provided
+        # message is already plain text; HTML is derived from it if not provided
         if html_message is None:
-            html_message = f"<html><body><p>{message}</p></body></html>"
+            html_message = _html_body(message)
         
         send_mail(
             subject=subject,
-            message=strip_tags(message),
+            message=message,
             from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[recipient.email],
             html_message=html_message,
             fail_silently=False,
         )
         
-        logger.info(f"Email sent to {recipient.email}: {subject}")
+        logger.debug("Email sent to %s: %s", recipient.email, subject)
         return True
         
     except Exception as e:
@@ -91,6 +175,73 @@ def send_notification_email(
         return False
 
 
+def send_notification_emails(
+    recipients: List[User],
+    subject: str,
+    message: str,
+    html_message: Optional[str] = None
+) -> List[User]:
+    """Send the same email to many users over one SMTP connection, returning those delivered to"""
+    if html_message is None:
+        html_message = _html_body(message)
+    
+    delivered = []
+    try:
+        with get_connection() as connection:
+            for recipient in recipients:
+                if not recipient.email:
+                    logger.warning(f"User {recipient.id} has no email address")
+                    continue
+                email = EmailMultiAlternatives(
+                    subject=subject,
+                    body=message,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    to=[recipient.email],
+                    connection=connection,
+                )
+                email.attach_alternative(html_message, 'text/html')
+                try:
+                    email.send()
+                    delivered.append(recipient)
+                except Exception as e:
+                    logger.error(f"Failed to send email to {recipient.email}: {str(e)}")
+    except Exception as e:
+        logger.error(f"Failed to open email connection: {str(e)}")
+    
+    logger.info(f"Email sent to {len(delivered)}/{len(recipients)} users: {subject}")
+    return delivered
+
+
+def deliver_notification_emails(
+    recipients: List[User],
+    subject: str,
+    message: str,
+    notification_ids: dict
+) -> None:
+    """Send fan-out emails and mark the matching in-app notifications as emailed"""
+    delivered = send_notification_emails(recipients, subject, message)
+    sent_ids = [notification_ids[user.id] for user in delivered if user.id in notification_ids]
+    if sent_ids:
+        Notification.objects.filter(pk__in=sent_ids).update(
+            email_sent=True,
+            email_sent_at=timezone.now(),
+        )
+
+
+def deliver_notification_email(
+    recipient: User,
+    subject: str,
+    message: str,
+    notification_id: Optional[int] = None
+) -> None:
+    """Send a notification email and mark the in-app notification as emailed"""
+    if send_notification_email(recipient=recipient, subject=subject, message=message) and notification_id:
+        Notification.objects.filter(pk=notification_id).update(
+            email_sent=True,
+            email_sent_at=timezone.now(),
+        )
+
+
 def create_notification(
     recipient: User,
     notification_type: str,
@@ -98,7 +249,8 @@ def create_notification(
     message: str,
     related_object_type: Optional[str] = None,
     related_object_id: Optional[str] = None,
-    send_email: bool = True
+    send_email: bool = True,
+    prefs: Optional[dict] = None
 ) -> Optional[Notification]:
     """
     Create a notification for a user
@@ -111,14 +263,17 @@ def create_notification(
         related_object_type: Type of related object (e.g., 'ticket')
         related_object_id: ID of related object
         send_email: Whether to also send an email (will check user preferences)
+        prefs: Recipient's preference flags if already loaded (read from cache otherwise)
     
     Returns:
         Created Notification object or None
     """
     notification = None
+    if prefs is None:
+        prefs = get_cached_preferences(recipient)
     
     # Check if in-app notification should be created
-    if should_send_inapp(recipient, notification_type):
+    if should_send_inapp(recipient, notification_type, prefs):
         notification = Notification.objects.create(
             recipient=recipient,
             type=notification_type,
@@ -127,43 +282,122 @@ def create_notification(
             related_object_type=related_object_type,
             related_object_id=related_object_id,
         )
-        logger.info(f"In-app notification created for {recipient.email}: {title}")
+        logger.debug("In-app notification created for %s: %s", recipient.email, title)
     
-    # Check if email should be sent
-    if send_email and should_send_email(recipient, notification_type):
-        email_sent = send_notification_email(
-            recipient=recipient,
-            subject=f"[Ticket System] {title}",
-            message=message,
+    # Check if email should be sent (delivered in the background)
+    if send_email and should_send_email(recipient, notification_type, prefs):
+        run_async(
+            deliver_notification_email,
+            recipient,
+            f"[Ticket System] {title}",
+            message,
+            notification.pk if notification else None,
         )
-        
-        if notification and email_sent:
-            notification.email_sent = True
-            notification.email_sent_at = timezone.now()
-            notification.save(update_fields=['email_sent', 'email_sent_at'])
     
     return notification
 
 
+NOTIFY_BATCH_SIZE = 500
+
+
+def notify_many(
+    recipients: Iterable[User],
+    notification_type: str,
+    title: str,
+    message: str,
+    related_object_type: Optional[str] = None,
+    related_object_id: Optional[str] = None,
+    send_email: bool = True
+) -> int:
+    """
+    Create the same notification for many users, returning how many in-app rows were created
+
+    Recipients are processed in batches of NOTIFY_BATCH_SIZE (querysets are
+    streamed with iterator()), so memory stays bounded for large fan-outs.
+    Each batch reads preferences from the cache (one query for misses),
+    writes its in-app rows with one bulk INSERT and queues one email task.
+    """
+    if isinstance(recipients, QuerySet):
+        recipients = recipients.iterator(chunk_size=NOTIFY_BATCH_SIZE)
+    recipients = iter(recipients)
+    
+    created = 0
+    while True:
+        batch = list(islice(recipients, NOTIFY_BATCH_SIZE))
+        if not batch:
+            break
+        created += _notify_batch(
+            batch, notification_type, title, message,
+            related_object_type, related_object_id, send_email,
+        )
+    
+    logger.info(f"{created} in-app notifications created: {title}")
+    return created
+
+
+def _notify_batch(
+    recipients: List[User],
+    notification_type: str,
+    title: str,
+    message: str,
+    related_object_type: Optional[str],
+    related_object_id: Optional[str],
+    send_email: bool
+) -> int:
+    prefs_map = get_preferences_map(recipients)
+    
+    inapp_recipients = []
+    email_recipients = []
+    for recipient in recipients:
+        prefs = prefs_map[recipient.id]
+        if should_send_inapp(recipient, notification_type, prefs):
+            inapp_recipients.append(recipient)
+        if send_email and should_send_email(recipient, notification_type, prefs):
+            email_recipients.append(recipient)
+    
+    notifications = Notification.bulk_notify(
+        inapp_recipients,
+        notification_type=notification_type,
+        title=title,
+        message=message,
+        related_object_type=related_object_type,
+        related_object_id=related_object_id,
+        batch_size=NOTIFY_BATCH_SIZE,
+    )
+    
+    if email_recipients:
+        # One task (and one SMTP connection) per batch
+        run_async(
+            deliver_notification_emails,
+            email_recipients,
+            f"[Ticket System] {title}",
+            message,
+            {notification.recipient_id: notification.pk for notification in notifications},
+        )
+    
+    return len(notifications)
+
+
 def notify_ticket_created(ticket, creator: User):
     """Notify relevant users when a ticket is created"""
-    from .models import User as UserModel
-    
+    run_async(_fanout_ticket_created, ticket, creator)
+
+
+def _fanout_ticket_created(ticket, creator: User):
     # Notify all support staff and managers about new ticket
-    staff_users = UserModel.objects.filter(
-        role__in=[UserModel.Role.SUPPORT_STAFF, UserModel.Role.MANAGER, UserModel.Role.ADMIN],
+    staff_users = User.objects.filter(
+        role__in=[User.Role.SUPPORT_STAFF, User.Role.MANAGER, User.Role.ADMIN],
         is_active=True
-    ).exclude(id=creator.id)
+    ).exclude(id=creator.id).only('id', 'email', 'name')
     
-    for user in staff_users:
-        create_notification(
-            recipient=user,
-            notification_type='ticket_created',
-            title=f"New Ticket: {ticket.title}",
-            message=f"A new ticket has been created by {creator.name or creator.email}.\n\nTitle: {ticket.title}\nPriority: {ticket.priority}\nCategory: {ticket.category.name if ticket.category else 'N/A'}",
-            related_object_type='ticket',
-            related_object_id=str(ticket.id),
-        )
+    notify_many(
+        staff_users,
+        notification_type='ticket_created',
+        title=f"New Ticket: {ticket.title}",
+        message=f"A new ticket has been created by {creator.name or creator.email}.\n\nTitle: {ticket.title}\nPriority: {ticket.priority}\nCategory: {ticket.category.name if ticket.category_id else 'N/A'}",
+        related_object_type='ticket',
+        related_object_id=str(ticket.id),
+    )
 
 
 def notify_ticket_assigned(ticket, assignee: User, assigner: User):
@@ -181,130 +415,175 @@ def notify_ticket_assigned(ticket, assignee: User, assigner: User):
     )
 
 
+def _active_users_by_id(*user_ids) -> dict:
+    """Fetch active users for ticket user ids in one query, keyed by str(id)"""
+    # Ticket user ids are stored as strings and may hold placeholders like "dev-user"
+    wanted = {user_id for user_id in user_ids if user_id and user_id.isdigit()}
+    if not wanted:
+        return {}
+    users = User.objects.filter(is_active=True).only('id', 'email', 'name').in_bulk(wanted)
+    return {str(pk): user for pk, user in users.items()}
+
+
 def notify_ticket_status_changed(ticket, old_status: str, new_status: str, changed_by: User):
     """Notify ticket requester when status changes"""
-    from .models import User as UserModel
+    # Ticket user ids are already strings; only the User pk needs converting (once)
+    changed_by_id = str(changed_by.id)
+    requester_id = ticket.requester_id
+    assignee_id = ticket.assignee_id
+    # The person making the change is never notified, so don't fetch them
+    users = _active_users_by_id(*(
+        user_id for user_id in (requester_id, assignee_id)
+        if user_id and user_id != changed_by_id
+    ))
+    change_details = f"Ticket: {ticket.title}\nOld Status: {old_status}\nNew Status: {new_status}\nUpdated by: {changed_by.name or changed_by.email}"
     
     # Notify the ticket requester
-    try:
-        requester = UserModel.objects.get(id=ticket.requester_id)
-        if requester.id != changed_by.id:
+    if requester_id != changed_by_id:
+        requester = users.get(requester_id)
+        if requester is None:
+            logger.warning(f"Requester not found for ticket {ticket.id}")
+        else:
             create_notification(
                 recipient=requester,
                 notification_type='ticket_status_changed',
                 title=f"Ticket Status Updated: {ticket.title}",
-                message=f"Your ticket status has been changed.\n\nTicket: {ticket.title}\nOld Status: {old_status}\nNew Status: {new_status}\nUpdated by: {changed_by.name or changed_by.email}",
+                message=f"Your ticket status has been changed.\n\n{change_details}",
                 related_object_type='ticket',
                 related_object_id=str(ticket.id),
             )
-    except UserModel.DoesNotExist:
-        logger.warning(f"Requester not found for ticket {ticket.id}")
     
     # If ticket has an assignee, notify them too
-    if ticket.assignee_id and str(ticket.assignee_id) != str(changed_by.id):
-        try:
-            assignee = UserModel.objects.get(id=ticket.assignee_id)
+    if assignee_id and assignee_id != changed_by_id:
+        assignee = users.get(assignee_id)
+        if assignee is not None:
             create_notification(
                 recipient=assignee,
                 notification_type='ticket_status_changed',
                 title=f"Assigned Ticket Updated: {ticket.title}",
-                message=f"A ticket assigned to you has been updated.\n\nTicket: {ticket.title}\nOld Status: {old_status}\nNew Status: {new_status}\nUpdated by: {changed_by.name or changed_by.email}",
+                message=f"A ticket assigned to you has been updated.\n\n{change_details}",
                 related_object_type='ticket',
                 related_object_id=str(ticket.id),
             )
-        except UserModel.DoesNotExist:
-            pass
+
+
+def _comment_window_key(ticket_id, user_id) -> str:
+    return f'notifcomment:window:{ticket_id}:{user_id}'
+
+
+def _comment_pending_key(ticket_id, user_id) -> str:
+    return f'notifcomment:pending:{ticket_id}:{user_id}'
+
+
+def _buffer_comment(ticket, recipient: User) -> bool:
+    """
+    Debounce comment notifications for one recipient on one ticket
+
+    The first comment in a NOTIFICATION_COMMENT_WINDOW opens the window and is
+    sent immediately (returns False). Later comments inside the window are only
+    counted (returns True) and flushed as a single digest when the window closes.
+    Disabled unless NOTIFICATION_COMMENT_WINDOW is set; see settings for the
+    shared-cache requirement.
+    """
+    window = getattr(settings, 'NOTIFICATION_COMMENT_WINDOW', 0)
+    if not window:
+        return False
+    if cache.add(_comment_window_key(ticket.id, recipient.id), True, window):
+        return False
+    
+    pending_key = _comment_pending_key(ticket.id, recipient.id)
+    if cache.add(pending_key, 1, window * 2):
+        # First suppressed comment in this window schedules the digest
+        run_later(window, _flush_comment_digest, ticket, recipient)
+    else:
+        try:
+            cache.incr(pending_key)
+        except ValueError:
+            # Counter expired between add() and incr(); count this comment afresh
+            cache.set(pending_key, 1, window * 2)
+    return True
+
+
+def _flush_comment_digest(ticket, recipient: User):
+    pending_key = _comment_pending_key(ticket.id, recipient.id)
+    count = cache.get(pending_key)
+    cache.delete(pending_key)
+    if not count:
+        return
+    create_notification(
+        recipient=recipient,
+        notification_type='ticket_comment',
+        title=f"New Comments on: {ticket.title}",
+        message=f"{count} more comment{'s' if count > 1 else ''} {'have' if count > 1 else 'has'} been added to the ticket.\n\nTicket: {ticket.title}",
+        related_object_type='ticket',
+        related_object_id=str(ticket.id),
+    )
 
 
 def notify_new_comment(ticket, comment, commenter: User):
     """Notify relevant users when a new comment is added"""
-    from .models import User as UserModel
-    
-    # Skip internal comments for end users
     if comment.is_internal:
-        # Only notify staff members
-        recipients = []
-        if ticket.assignee_id and str(ticket.assignee_id) != str(commenter.id):
-            try:
-                assignee = UserModel.objects.get(id=ticket.assignee_id)
-                recipients.append(assignee)
-            except UserModel.DoesNotExist:
-                pass
+        # Internal comments only go to the assignee (staff)
+        candidate_ids = [ticket.assignee_id]
     else:
         # Notify requester and assignee
-        recipients = []
-        
-        # Notify requester
-        if str(ticket.requester_id) != str(commenter.id):
-            try:
-                requester = UserModel.objects.get(id=ticket.requester_id)
-                recipients.append(requester)
-            except UserModel.DoesNotExist:
-                pass
-        
-        # Notify assignee
-        if ticket.assignee_id and str(ticket.assignee_id) != str(commenter.id):
-            try:
-                assignee = UserModel.objects.get(id=ticket.assignee_id)
-                if assignee not in recipients:
-                    recipients.append(assignee)
-            except UserModel.DoesNotExist:
-                pass
+        candidate_ids = [ticket.requester_id, ticket.assignee_id]
     
-    for recipient in recipients:
-        create_notification(
-            recipient=recipient,
-            notification_type='ticket_comment',
-            title=f"New Comment on: {ticket.title}",
-            message=f"A new comment has been added to the ticket.\n\nTicket: {ticket.title}\nComment by: {commenter.name or commenter.email}\n\n{comment.content[:200]}{'...' if len(comment.content) > 200 else ''}",
-            related_object_type='ticket',
-            related_object_id=str(ticket.id),
-        )
+    commenter_id = str(commenter.id)
+    candidate_ids = [
+        user_id for user_id in candidate_ids
+        if user_id and user_id != commenter_id
+    ]
+    users = _active_users_by_id(*candidate_ids)
+    # dict.fromkeys keeps requester-first order and drops requester == assignee duplicates
+    recipients = [users[user_id] for user_id in dict.fromkeys(candidate_ids) if user_id in users]
+    # Bursts of comments on one ticket are coalesced into a digest per recipient
+    recipients = [recipient for recipient in recipients if not _buffer_comment(ticket, recipient)]
+    if not recipients:
+        return
+    
+    # Same title/body for every recipient: one INSERT batch, one email task, one email_sent UPDATE
+    notify_many(
+        recipients,
+        notification_type='ticket_comment',
+        title=f"New Comment on: {ticket.title}",
+        message=f"A new comment has been added to the ticket.\n\nTicket: {ticket.title}\nComment by: {commenter.name or commenter.email}\n\n{comment.content[:200]}{'...' if len(comment.content) > 200 else ''}",
+        related_object_type='ticket',
+        related_object_id=str(ticket.id),
+    )
 
 
 def notify_sla_warning(ticket, warning_type: str = 'warning'):
     """Notify assignee and managers about SLA warning/breach"""
-    from .models import User as UserModel
-    
+    run_async(_fanout_sla_warning, ticket, warning_type)
+
+
+def _fanout_sla_warning(ticket, warning_type: str):
     notification_type = 'sla_breached' if warning_type == 'breached' else 'sla_warning'
     title_prefix = "SLA BREACHED" if warning_type == 'breached' else "SLA Warning"
     
-    recipients = []
+    # Managers/admins plus the assignee, fetched (and deduplicated) in one query
+    recipient_filter = Q(role__in=[User.Role.MANAGER, User.Role.ADMIN])
+    if ticket.assignee_id and ticket.assignee_id.isdigit():
+        recipient_filter |= Q(id=ticket.assignee_id)
+    recipients = User.objects.filter(
+        recipient_filter, is_active=True
+    ).only('id', 'email', 'name').order_by()
     
-    # Notify assignee
-    if ticket.assignee_id:
-        try:
-            assignee = UserModel.objects.get(id=ticket.assignee_id)
-            recipients.append(assignee)
-        except UserModel.DoesNotExist:
-            pass
-    
-    # Notify managers
-    managers = UserModel.objects.filter(
-        role__in=[UserModel.Role.MANAGER, UserModel.Role.ADMIN],
-        is_active=True
+    notify_many(
+        recipients,
+        notification_type=notification_type,
+        title=f"{title_prefix}: {ticket.title}",
+        message=f"Ticket SLA {'has been breached' if warning_type == 'breached' else 'is at risk'}.\n\nTicket: {ticket.title}\nPriority: {ticket.priority}\nStatus: {ticket.status}",
+        related_object_type='ticket',
+        related_object_id=str(ticket.id),
     )
-    for manager in managers:
-        if manager not in recipients:
-            recipients.append(manager)
-    
-    for recipient in recipients:
-        create_notification(
-            recipient=recipient,
-            notification_type=notification_type,
-            title=f"{title_prefix}: {ticket.title}",
-            message=f"Ticket SLA {'has been breached' if warning_type == 'breached' else 'is at risk'}.\n\nTicket: {ticket.title}\nPriority: {ticket.priority}\nStatus: {ticket.status}",
-            related_object_type='ticket',
-            related_object_id=str(ticket.id),
-        )
 
 
 def notify_system(recipients: List[User], title: str, message: str):
     """Send system notification to multiple users"""
-    for recipient in recipients:
-        create_notification(
-            recipient=recipient,
-            notification_type='system',
-            title=title,
-            message=message,
-        )
+    run_async(_fanout_system, list(recipients), title, message)
+
+
+def _fanout_system(recipients: List[User], title: str, message: str):
+    notify_many(recipients, notification_type='system', title=title, message=message)
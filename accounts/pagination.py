@@ -2,7 +2,10 @@
 自定义分页类
 符合 API 文档要求的分页格式
 """
-from rest_framework.pagination import PageNumberPagination
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
@@ -26,3 +29,93 @@ class CustomPagination(PageNumberPagination):
             'total': self.page.paginator.count,
             'totalPages': self.page.paginator.num_pages
         })
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    大表分页器
+    未过滤的 PostgreSQL 大表用 pg_class.reltuples 估算总数，避免全表 COUNT(*)
+    """
+    # 估算值低于该阈值时仍使用精确 COUNT
+    estimate_threshold = 100000
+    
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is not None and not query.where:
+            estimate = self._estimate_table_rows(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+    
+    @staticmethod
+    def _estimate_table_rows(queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+
+class EstimatedCountPagination(CustomPagination):
+    """
+    大表分页类（审计日志等）
+    total 在未过滤的大表上为估算值
+    """
+    django_paginator_class = EstimatedCountPaginator
+
+
+class CustomCursorPagination(CursorPagination):
+    """
+    游标分页类（按时间倒序的追加型列表）
+    基于索引定位而非 OFFSET，深分页不再变慢
+    返回格式: {items, pageSize, next, previous}
+    """
+    page_size = 20
+    page_size_query_param = 'pageSize'
+    max_page_size = 100
+    ordering = '-created_at'
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'items': data,
+            'pageSize': self.page_size,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+        })
+
+
+class AuditLogCursorPagination(CustomCursorPagination):
+    """审计日志游标分页类"""
+    page_size = 50
+    ordering = '-timestamp'
+
+
+class CursorPaginationMixin:
+    """
+    视图混入：请求带 cursor 参数时改用 cursor_pagination_class
+    不带 cursor 时保持原有的页码分页，兼容现有客户端
+    """
+    cursor_pagination_class = None
+    
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            request = getattr(self, 'request', None)
+            if (
+                self.cursor_pagination_class is not None
+                and request is not None
+                and self.cursor_pagination_class.cursor_query_param in request.query_params
+            ):
+                self._paginator = self.cursor_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
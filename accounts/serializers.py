@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from .models import User, Team, TeamMembership, AuditLog, Notification, NotificationPreference
+from .serializers_cache import CachedFieldsMixin
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """用户序列化器 - 符合 API 文档规范"""
     
     # 驼峰命名的字段
@@ -38,6 +40,13 @@ class UserCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['email', 'name', 'role', 'department', 'phone', 'avatar']
+        extra_kwargs = {
+            # 邮箱大小写不敏感唯一
+            'email': {'validators': [UniqueValidator(queryset=User.objects.all(), lookup='iexact')]},
+        }
+    
+    def validate_email(self, value):
+        return value.lower()
     
     def create(self, validated_data):
         # 为 SSO 用户创建账号（不需要密码）
@@ -57,7 +66,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         fields = ['name', 'role', 'department', 'phone', 'isActive', 'avatar']
 
 
-class CurrentUserSerializer(serializers.ModelSerializer):
+class CurrentUserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """当前用户序列化器（用于 /auth/me 接口）"""
     
     isActive = serializers.BooleanField(source='is_active', read_only=True)
@@ -73,7 +82,7 @@ class CurrentUserSerializer(serializers.ModelSerializer):
 
 # ========== Team Serializers ==========
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Team member serializer"""
     
     id = serializers.IntegerField(source='pk', read_only=True)
@@ -87,7 +96,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
         fields = ['id', 'userId', 'userName', 'userEmail', 'role', 'joinedAt']
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Team serializer for list and detail views"""
     
     leaderId = serializers.IntegerField(source='leader.id', read_only=True)
@@ -105,6 +114,22 @@ class TeamSerializer(serializers.ModelSerializer):
                            'memberCount', 'activeTickets', 'createdAt']
 
 
+class TeamListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Lightweight team serializer for list views (no nested members)"""
+    
+    leaderId = serializers.IntegerField(source='leader.id', read_only=True)
+    leaderName = serializers.CharField(source='leader.name', read_only=True)
+    memberCount = serializers.IntegerField(source='member_count', read_only=True)
+    activeTickets = serializers.IntegerField(source='active_tickets', read_only=True)
+    createdAt = serializers.DateTimeField(source='created_at', read_only=True)
+    
+    class Meta:
+        model = Team
+        fields = ['id', 'name', 'description', 'leaderId', 'leaderName',
+                  'memberCount', 'activeTickets', 'createdAt']
+        read_only_fields = fields
+
+
 class TeamCreateSerializer(serializers.ModelSerializer):
     """Team create serializer"""
     
@@ -141,6 +166,13 @@ class AddTeamMemberSerializer(serializers.Serializer):
     userId = serializers.IntegerField()
     role = serializers.ChoiceField(choices=['leader', 'member'])
     
+    def to_internal_value(self, data):
+        """Accept snake_case user_id (CamelCaseJSONParser output) as an alias of userId"""
+        if 'user_id' in data and 'userId' not in data:
+            data = data.copy()
+            data['userId'] = data['user_id']
+        return super().to_internal_value(data)
+    
     def validate_userId(self, value):
         """Validate user exists"""
         try:
@@ -157,6 +189,8 @@ class AddTeamMemberSerializer(serializers.Serializer):
             if getattr(user, 'role', None) == 'end_user':
                 raise serializers.ValidationError("Cannot add end users to teams")
 
+        # Reused by the view so the user is not fetched a second time
+        self.context['user_obj'] = user
         return value
     
     def validate(self, data):
@@ -172,7 +206,7 @@ class AddTeamMemberSerializer(serializers.Serializer):
 
 # ========== Audit Log Serializers ==========
 
-class AuditLogSerializer(serializers.ModelSerializer):
+class AuditLogSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Audit log serializer"""
     
     userId = serializers.IntegerField(source='user.id', read_only=True)
@@ -220,7 +254,7 @@ class ChangeRoleRequestSerializer(serializers.Serializer):
     role = serializers.ChoiceField(choices=User.Role.choices)
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """通知序列化器"""
     
     relatedObjectType = serializers.CharField(source='related_object_type', allow_null=True)
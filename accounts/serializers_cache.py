@@ -0,0 +1,34 @@
+"""
+序列化器字段缓存
+每次实例化序列化器时 get_fields() 都会 deepcopy 全部字段，
+列表接口上这是主要的 CPU 开销；这里按类缓存一次字段定义，之后只做浅拷贝
+"""
+import copy
+
+from rest_framework.fields import DictField, ListField
+from rest_framework.relations import ManyRelatedField
+from rest_framework.serializers import BaseSerializer
+
+
+class CachedFieldsMixin:
+    """
+    按序列化器类缓存 get_fields() 的结果
+
+    缓存中的字段从未 bind，每个实例拿到的是各自的拷贝：
+    普通字段浅拷贝即可；带子字段的（嵌套序列化器、多对多关系、List/DictField）仍需 deepcopy，
+    因为子字段在构造时已绑定到父字段上
+    """
+
+    _deep_copied_fields = (BaseSerializer, ManyRelatedField, ListField, DictField)
+
+    def get_fields(self):
+        cls = type(self)
+        # 用 cls.__dict__ 而不是 getattr，避免子类复用父类的缓存
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return {
+            name: copy.deepcopy(field) if isinstance(field, self._deep_copied_fields) else copy.copy(field)
+            for name, field in cached.items()
+        }
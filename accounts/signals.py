@@ -0,0 +1,35 @@
+"""
+Signal handlers for the accounts app
+"""
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import NotificationPreference, Team, TeamMembership
+from .notifications import preference_cache_key
+
+
+def _adjust_member_count(membership, delta):
+    """Apply delta to the stored Team.member_count without reading the row"""
+    Team.objects.filter(pk=membership.team_id).update(member_count=F('member_count') + delta)
+    # Keep an already-loaded team instance in step (e.g. the one passed to create())
+    if TeamMembership._meta.get_field('team').is_cached(membership):
+        membership.team.member_count += delta
+
+
+@receiver(post_save, sender=TeamMembership)
+def increment_team_member_count(sender, instance, created, **kwargs):
+    if created:
+        _adjust_member_count(instance, 1)
+
+
+@receiver(post_delete, sender=TeamMembership)
+def decrement_team_member_count(sender, instance, **kwargs):
+    _adjust_member_count(instance, -1)
+
+
+@receiver(post_save, sender=NotificationPreference)
+@receiver(post_delete, sender=NotificationPreference)
+def invalidate_cached_preferences(sender, instance, **kwargs):
+    cache.delete(preference_cache_key(instance.user_id))
@@ -0,0 +1,49 @@
+"""
+Background Task Module
+Runs notification work off the request thread once the current transaction commits
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'NOTIFICATION_WORKERS', 4),
+    thread_name_prefix='notifications',
+)
+
+
+def _run(func, args, kwargs):
+    """Execute a task in a worker thread, releasing its DB connection afterwards"""
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception(f"Background task {func.__name__} failed")
+    finally:
+        close_old_connections()
+
+
+def run_async(func, *args, **kwargs):
+    """
+    Schedule func(*args, **kwargs) on the notification thread pool
+
+    The task is submitted after the surrounding transaction commits so workers
+    never read rows that are not yet visible. With NOTIFICATIONS_ASYNC=False the
+    task runs inline instead.
+    """
+    if not getattr(settings, 'NOTIFICATIONS_ASYNC', True):
+        func(*args, **kwargs)
+        return
+    transaction.on_commit(lambda: _executor.submit(_run, func, args, kwargs))
+
+
+def run_later(delay, func, *args, **kwargs):
+    """Schedule func(*args, **kwargs) on the notification thread pool after delay seconds"""
+    timer = threading.Timer(delay, _executor.submit, args=(_run, func, args, kwargs))
+    timer.daemon = True
+    timer.start()
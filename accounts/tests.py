@@ -1,3 +1,330 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Notification, Team, TeamMembership, User
+
+
+class TeamMembershipAPITestCase(APITestCase):
+    """Test case for team member management API"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            username='manager',
+            email='manager@test.com',
+            password='testpass123',
+            role=User.Role.MANAGER
+        )
+        cls.agent = User.objects.create_user(
+            username='agent',
+            email='agent@test.com',
+            password='testpass123',
+            role=User.Role.SUPPORT_STAFF
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.post('/api/teams/', {'name': 'Support'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.team = Team.objects.get(name='Support')
+
+    def test_adding_leader_hands_off_leadership(self):
+        """Test: Adding a member as leader demotes the current leader"""
+        response = self.client.post(
+            f'/api/teams/{self.team.id}/members/',
+            {'userId': self.agent.id, 'role': 'leader'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['leaderId'], self.agent.id)
+
+        roles = dict(
+            TeamMembership.objects.filter(team=self.team).values_list('user_id', 'role')
+        )
+        self.assertEqual(roles, {self.manager.id: 'member', self.agent.id: 'leader'})
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.leader_id, self.agent.id)
+
+    def test_adding_existing_member_reports_duplicate(self):
+        """Test: Re-adding a member is rejected as a duplicate, not as a second leader"""
+        response = self.client.post(
+            f'/api/teams/{self.team.id}/members/',
+            {'userId': self.manager.id, 'role': 'leader'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            TeamMembership.objects.get(team=self.team, user=self.manager).role,
+            'leader'
+        )
+
+
+class CounterColumnSaveTestCase(TestCase):
+    """Test case for saving models that carry F()-maintained counter columns"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='counter',
+            email='counter@test.com',
+            password='testpass123'
+        )
+        cls.team = Team.objects.create(name='Counters', leader=cls.user)
+
+    def test_stale_user_save_keeps_unread_count(self):
+        """Test: A full save of a stale user does not write back unread_notification_count"""
+        User.adjust_unread_notification_count([self.user.pk], 3)
+        self.user.name = 'Renamed'
+        self.user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.name, 'Renamed')
+        self.assertEqual(self.user.unread_notification_count, 3)
+
+    def test_deferred_user_save_keeps_unread_count(self):
+        """Test: Saving a partially loaded user (like request.user) keeps the counter"""
+        user = User.objects.only('id', 'email', 'username', 'name', 'unread_notification_count').get(
+            pk=self.user.pk
+        )
+        User.adjust_unread_notification_count([self.user.pk], 2)
+        user.name = 'Partial'
+        user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.name, 'Partial')
+        self.assertEqual(self.user.unread_notification_count, 2)
+
+    def test_stale_team_save_keeps_member_count(self):
+        """Test: A full save of a stale team does not write back member_count"""
+        TeamMembership.objects.create(team_id=self.team.pk, user=self.user)
+        self.team.description = 'Updated'
+        self.team.save()
+
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.description, 'Updated')
+        self.assertEqual(self.team.member_count, 1)
+
+    def test_save_after_delete_reinserts_row(self):
+        """Test: Saving an instance whose row was deleted inserts it again"""
+        Team.objects.filter(pk=self.team.pk).delete()
+        self.team.save()
+        self.assertTrue(Team.objects.filter(pk=self.team.pk).exists())
+
+        User.objects.filter(pk=self.user.pk).delete()
+        self.user.save()
+        self.assertTrue(User.objects.filter(pk=self.user.pk).exists())
+
+
+class UnreadNotificationCountTestCase(TestCase):
+    """Test case for the denormalized User.unread_notification_count"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='reader',
+            email='reader@test.com',
+            password='testpass123'
+        )
+        cls.other = User.objects.create_user(
+            username='other',
+            email='other@test.com',
+            password='testpass123'
+        )
+
+    def notify(self, recipient=None, **kwargs):
+        return Notification.objects.create(
+            recipient=recipient or self.user, title='Title', message='Message', **kwargs
+        )
+
+    def unread_count(self, user=None):
+        user = user or self.user
+        user.refresh_from_db(fields=['unread_notification_count'])
+        return user.unread_notification_count
+
+    def test_create_unread_and_read(self):
+        """Test: Creating an unread notification increments, a read one does not"""
+        self.notify()
+        self.notify(is_read=True)
+        self.assertEqual(self.unread_count(), 1)
+
+    def test_toggle_is_read_with_update_fields(self):
+        """Test: Toggling is_read via save(update_fields=...) moves the counter"""
+        notification = self.notify()
+        notification.is_read = True
+        notification.save(update_fields=['is_read'])
+        self.assertEqual(self.unread_count(), 0)
+
+        notification.is_read = False
+        notification.save(update_fields=['is_read'])
+        self.assertEqual(self.unread_count(), 1)
+
+        # Saving other columns leaves the counter alone
+        notification.title = 'Edited'
+        notification.save(update_fields=['title'])
+        self.assertEqual(self.unread_count(), 1)
+
+    def test_toggle_is_read_on_deferred_instance(self):
+        """Test: The persisted state is looked up when is_read was not loaded"""
+        notification = self.notify()
+        deferred = Notification.objects.only('id', 'recipient').get(pk=notification.pk)
+        deferred.is_read = True
+        deferred.save(update_fields=['is_read'])
+        self.assertEqual(self.unread_count(), 0)
+
+    def test_delete_unread_and_read(self):
+        """Test: Deleting an unread notification decrements, a read one does not"""
+        unread = self.notify()
+        read = self.notify(is_read=True)
+        read.delete()
+        self.assertEqual(self.unread_count(), 1)
+        unread.delete()
+        self.assertEqual(self.unread_count(), 0)
+
+    def test_bulk_notify_counts_per_recipient(self):
+        """Test: bulk_notify adds the number of rows created for each recipient"""
+        Notification.bulk_notify(
+            [self.user, self.other, self.user],
+            notification_type=Notification.NotificationType.SYSTEM,
+            title='Title',
+            message='Message',
+        )
+        self.assertEqual(self.unread_count(), 2)
+        self.assertEqual(self.unread_count(self.other), 1)
+
+    def test_mark_many_as_read_delta(self):
+        """Test: mark_many_as_read subtracts only the rows it actually changed"""
+        first, second, _third = self.notify(), self.notify(), self.notify()
+        self.notify(recipient=self.other)
+
+        self.assertEqual(Notification.mark_many_as_read(self.user, ids=[first.pk, second.pk]), 2)
+        self.assertEqual(self.unread_count(), 1)
+
+        # Already read rows are not counted twice
+        self.assertEqual(Notification.mark_many_as_read(self.user), 1)
+        self.assertEqual(self.unread_count(), 0)
+        self.assertEqual(self.unread_count(self.other), 1)
+
+    def test_mark_as_read_sets_read_at(self):
+        """Test: mark_as_read updates the instance and the row with the same read_at"""
+        notification = self.notify()
+        notification.mark_as_read()
+        self.assertTrue(notification.is_read)
+        self.assertIsNotNone(notification.read_at)
+        self.assertEqual(self.unread_count(), 0)
+
+        stored = Notification.objects.get(pk=notification.pk)
+        self.assertTrue(stored.is_read)
+        self.assertEqual(stored.read_at, notification.read_at)
+
+    def test_counter_never_goes_below_zero(self):
+        """Test: A negative adjustment is floored at zero"""
+        self.notify()
+        User.adjust_unread_notification_count([self.user.pk], -5)
+        self.assertEqual(self.unread_count(), 0)
+
+
+class TeamMemberCountTestCase(APITestCase):
+    """Test case for the stored Team.member_count"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        cls.agents = [
+            User.objects.create_user(
+                username=f'agent{i}',
+                email=f'agent{i}@test.com',
+                password='testpass123',
+                role=User.Role.SUPPORT_STAFF
+            )
+            for i in range(2)
+        ]
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post('/api/teams/', {'name': 'Counted'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.team = Team.objects.get(name='Counted')
+
+    def stored_count(self):
+        self.team.refresh_from_db(fields=['member_count'])
+        return self.team.member_count
+
+    def add_member(self, user):
+        response = self.client.post(
+            f'/api/teams/{self.team.id}/members/',
+            {'userId': user.id, 'role': 'member'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()['data']
+
+    def test_add_and_remove_member(self):
+        """Test: add_member / remove_member keep the stored and returned counts in step"""
+        self.assertEqual(self.stored_count(), 1)
+
+        data = self.add_member(self.agents[0])
+        self.assertEqual(data['memberCount'], 2)
+        self.assertEqual(self.stored_count(), 2)
+
+        response = self.client.delete(f'/api/teams/{self.team.id}/members/{self.agents[0].id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['memberCount'], 1)
+        self.assertEqual(self.stored_count(), 1)
+
+        # Removing a non-member changes nothing
+        response = self.client.delete(f'/api/teams/{self.team.id}/members/{self.agents[1].id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.stored_count(), 1)
+
+    def test_admin_inline_delete(self):
+        """Test: Deleting a membership through the team admin inline decrements the count"""
+        for agent in self.agents:
+            self.add_member(agent)
+        memberships = list(TeamMembership.objects.filter(team=self.team).order_by('-joined_at', '-id'))
+        self.assertEqual(self.stored_count(), 3)
+
+        data = {
+            'name': self.team.name,
+            'description': '',
+            'leader': self.admin.id,
+            'memberships-TOTAL_FORMS': len(memberships),
+            'memberships-INITIAL_FORMS': len(memberships),
+            'memberships-MIN_NUM_FORMS': 0,
+            'memberships-MAX_NUM_FORMS': 1000,
+        }
+        for i, membership in enumerate(memberships):
+            data.update({
+                f'memberships-{i}-id': membership.id,
+                f'memberships-{i}-team': self.team.id,
+                f'memberships-{i}-user': membership.user_id,
+                f'memberships-{i}-role': membership.role,
+            })
+            if membership.user_id == self.agents[0].id:
+                data[f'memberships-{i}-DELETE'] = 'on'
+
+        admin_client = self.client_class()
+        admin_client.force_login(self.admin)
+        response = admin_client.post(f'/admin/accounts/team/{self.team.id}/change/', data)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(TeamMembership.objects.filter(team=self.team, user=self.agents[0]).exists())
+        self.assertEqual(self.stored_count(), 2)
+
+    def test_sync_team_member_counts(self):
+        """Test: sync_team_member_counts repairs a drifted counter"""
+        self.add_member(self.agents[0])
+        empty_team = Team.objects.create(name='Empty')
+        Team.objects.filter(pk__in=[self.team.pk, empty_team.pk]).update(member_count=42)
 
-# Create your tests here.
+        call_command('sync_team_member_counts', stdout=StringIO())
+        self.assertEqual(self.stored_count(), 2)
+        empty_team.refresh_from_db()
+        self.assertEqual(empty_team.member_count, 0)
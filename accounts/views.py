@@ -1,11 +1,17 @@
 import os
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, Q
 from django.utils import timezone
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.shortcuts import get_object_or_404
+from rest_framework_simplejwt.tokens import RefreshToken
+import requests as http_requests
+from requests.adapters import HTTPAdapter
 from google.oauth2 import id_token
 from google.auth.transport import requests
 from drf_spectacular.utils import extend_schema, OpenApiResponse
@@ -19,6 +25,7 @@ from .serializers import (
     UserUpdateSerializer,
     CurrentUserSerializer,
     TeamSerializer,
+    TeamListSerializer,
     TeamCreateSerializer,
     TeamUpdateSerializer,
     AddTeamMemberSerializer,
@@ -33,11 +40,35 @@ from .serializers import (
     NotificationPreferenceSerializer,
 )
 from .response_wrapper import APIResponse, success_response, error_response
-from .pagination import CustomPagination
+from .pagination import (
+    AuditLogCursorPagination,
+    CustomPagination,
+    CustomCursorPagination,
+    CursorPaginationMixin,
+    EstimatedCountPagination,
+)
 
 
 # ===== 辅助函数 =====
 
+# 角色相关的静态数据，模块加载时生成一次
+VALID_ROLES = frozenset(User.Role.values)
+ROLE_ITEMS = [
+    {"value": value, "label": label}
+    for value, label in User.Role.choices
+]
+
+# 进程级共享的 HTTP 会话：复用到 Google 证书端点的 TLS 连接
+_google_session = http_requests.Session()
+_google_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+_google_request = requests.Request(session=_google_session)
+
+# 管理员邮箱白名单，模块加载时解析一次
+_ADMIN_EMAILS = frozenset(
+    e.strip().lower() for e in os.getenv('ADMIN_EMAILS', '').split(',') if e.strip()
+)
+
+
 def get_client_ip(request):
     """获取客户端 IP 地址"""
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -49,15 +80,16 @@ def get_client_ip(request):
 
 
 def create_audit_log(user, action, details=None, request=None):
-    """创建审计日志"""
+    """创建审计日志（在请求线程上、当前事务提交后写入；回滚的操作不会留下日志）"""
     ip_address = get_client_ip(request) if request else None
-    AuditLog.objects.create(
+    log = AuditLog(
         user=user,
         user_email=user.email,
         action=action,
         details=details or '',
         ip_address=ip_address
     )
+    transaction.on_commit(lambda: AuditLog.objects.bulk_create([log]))
     return True
 
 
@@ -101,10 +133,9 @@ class UserViewSet(viewsets.ModelViewSet):
         # 关键词搜索
         keyword = request.query_params.get('keyword', None)
         if keyword:
-            from django.db import models
             queryset = queryset.filter(
-                models.Q(name__icontains=keyword) | 
-                models.Q(email__icontains=keyword)
+                Q(name__icontains=keyword) |
+                Q(email__icontains=keyword)
             )
         
         # 角色过滤
@@ -201,7 +232,7 @@ class UserViewSet(viewsets.ModelViewSet):
         user = self.get_object()
         role = request.data.get('role')
         
-        if role not in [choice[0] for choice in User.Role.choices]:
+        if not isinstance(role, str) or role not in VALID_ROLES:
             return error_response(
                 message='Invalid role',
                 code=400,
@@ -241,8 +272,6 @@ class UserViewSet(viewsets.ModelViewSet):
 
 # ===== 认证相关视图 =====
 
-from rest_framework.views import APIView
-
 class RoleView(APIView):
     """
     获取所有可用角色
@@ -259,11 +288,7 @@ class RoleView(APIView):
         tags=["Roles"]
     )
     def get(self, request):
-        roles = [
-            {"value": choice[0], "label": choice[1]}
-            for choice in User.Role.choices
-        ]
-        return success_response(roles)
+        return success_response(ROLE_ITEMS)
 
 
 class LoginView(APIView):
@@ -272,7 +297,7 @@ class LoginView(APIView):
     POST /auth/sso
     """
     permission_classes = [AllowAny]
-    google_request = requests.Request()
+    google_request = _google_request
     
     @extend_schema(
         request=LoginRequestSerializer,
@@ -291,7 +316,6 @@ class LoginView(APIView):
         if not ssoToken:
             return error_response('ssoToken is required', 400, status.HTTP_400_BAD_REQUEST)
         
-        from django.conf import settings
         client_id = settings.GOOGLE_OAUTH_CLIENT_ID
         
         if not client_id:
@@ -304,6 +328,7 @@ class LoginView(APIView):
             email = payload.get('email')
             if not email:
                 return error_response('Email not found in token', 400, status.HTTP_400_BAD_REQUEST)
+            email = email.lower()
             
             name = payload.get('name', '')
             avatar_url = payload.get('picture', '')
@@ -312,10 +337,7 @@ class LoginView(APIView):
             if not email_verified:
                 return error_response('Email not verified by Google', 403, status.HTTP_403_FORBIDDEN)
 
-            from rest_framework_simplejwt.tokens import RefreshToken
-
-            admin_emails = os.getenv('ADMIN_EMAILS', '').split(',')
-            is_admin = email in admin_emails
+            is_admin = email in _ADMIN_EMAILS
             
             user, created = User.objects.get_or_create(
                 email=email,
@@ -329,9 +351,16 @@ class LoginView(APIView):
             )
 
             if not created:
-                user.name = name
-                user.avatar_url = avatar_url
-                user.save()
+                # 仅在 Google 资料有变化时写库
+                changed_fields = []
+                if user.name != name:
+                    user.name = name
+                    changed_fields.append('name')
+                if user.avatar_url != avatar_url:
+                    user.avatar_url = avatar_url
+                    changed_fields.append('avatar_url')
+                if changed_fields:
+                    user.save(update_fields=changed_fields + ['updated_at'])
 
             if not user.is_active:
                 return error_response('User account is disabled', 403, status.HTTP_403_FORBIDDEN)
@@ -377,8 +406,6 @@ class LogoutView(APIView):
     )
     def post(self, request):
         try:
-            from rest_framework_simplejwt.tokens import RefreshToken
-            
             # 获取 refresh token（从 body 或让客户端传）
             refresh_token = request.data.get('refresh_token')
             
@@ -451,8 +478,34 @@ class TeamViewSet(viewsets.ModelViewSet):
             return TeamCreateSerializer
         elif self.action in ['update', 'partial_update']:
             return TeamUpdateSerializer
+        elif self.action == 'list' and self._summary_requested():
+            return TeamListSerializer
         return TeamSerializer
     
+    def _summary_requested(self):
+        """?summary=true 时列表只返回团队概要，不展开成员"""
+        request = getattr(self, 'request', None)
+        return request is not None and request.query_params.get('summary') == 'true'
+
+    
+    def get_queryset(self):
+        """列表/详情预取 leader 与成员，避免 N+1 查询"""
+        queryset = super().get_queryset()
+        if self.action == 'list' and self._summary_requested():
+            queryset = queryset.select_related('leader')
+        elif self.action in ['list', 'retrieve']:
+            # 成员操作 (add_member/remove_member) 会修改成员，不能使用预取缓存
+            queryset = queryset.select_related('leader').prefetch_related(
+                Prefetch(
+                    'memberships',
+                    queryset=TeamMembership.objects.select_related('user').only(
+                        'id', 'team', 'user', 'role', 'joined_at',
+                        'user__id', 'user__name', 'user__email',
+                    ),
+                )
+            )
+        return queryset
+    
     def get_permissions(self):
         """根据不同的 action 设置不同的权限"""
         # 管理员和经理可以创建团队
@@ -532,40 +585,46 @@ class TeamViewSet(viewsets.ModelViewSet):
         """
         team = self.get_object()
 
-        # Normalize incoming keys: accept snake_case (e.g. user_id) and map to serializer camelCase fields
-        try:
-            incoming = request.data.copy() if hasattr(request.data, 'copy') else dict(request.data)
-        except Exception:
-            incoming = dict(request.data)
-
-        key_map = {
-            'user_id': 'userId',
-        }
-        for snake, camel in key_map.items():
-            if snake in incoming and camel not in incoming:
-                incoming[camel] = incoming.pop(snake)
-
         serializer = AddTeamMemberSerializer(
-            data=incoming,
+            data=request.data,
             context={'team': team}
         )
         serializer.is_valid(raise_exception=True)
         
         # 添加成员
-        user_id = serializer.validated_data['userId']
         role = serializer.validated_data['role']
-        user = User.objects.get(id=user_id)
-        
-        membership = TeamMembership.objects.create(
-            team=team,
-            user=user,
-            role=role
-        )
+        user = serializer.context['user_obj']  # validate_userId 已查询过该用户
         
-        # 如果角色是 leader，更新团队的 leader 字段
-        if role == 'leader':
-            team.leader = user
-            team.save()
+        try:
+            # leader 交接、成员创建与 leader 更新在同一事务中完成
+            with transaction.atomic():
+                if role == 'leader':
+                    # 原 leader 降为普通成员，新 leader 才能满足 one_leader_per_team
+                    TeamMembership.objects.filter(
+                        team=team, role=TeamMembership.MemberRole.LEADER
+                    ).update(role=TeamMembership.MemberRole.MEMBER)
+                
+                membership = TeamMembership.objects.create(
+                    team=team,
+                    user=user,
+                    role=role
+                )
+                
+                # 如果角色是 leader，更新团队的 leader 字段
+                if role == 'leader':
+                    team.leader = user
+                    team.save(update_fields=['leader', 'updated_at'])
+        except IntegrityError:
+            # 由数据库约束保证成员不重复、每个团队只有一个 leader；按实际冲突返回提示
+            if TeamMembership.objects.filter(team=team, user=user).exists():
+                message = 'User is already a member of this team'
+            else:
+                message = 'Team already has a leader'
+            return error_response(
+                message=message,
+                code=400,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         
         # 返回更新后的团队信息
         team_serializer = TeamSerializer(team)
@@ -590,32 +649,41 @@ class TeamViewSet(viewsets.ModelViewSet):
         """
         team = self.get_object()
         
-        try:
-            membership = TeamMembership.objects.get(team=team, user_id=user_id)
-            membership.delete()
-            
-            # 如果移除的是 leader，清除团队的 leader
-            if team.leader_id == int(user_id):
-                team.leader = None
-                team.save()
-            
-            # 返回更新后的团队信息
-            team_serializer = TeamSerializer(team)
-            return success_response(
-                team_serializer.data,
-                message='Member removed successfully'
-            )
-        except TeamMembership.DoesNotExist:
+        if not user_id.isdigit():
             return error_response(
                 message='Member not found in this team',
                 code=404,
                 status_code=status.HTTP_404_NOT_FOUND
             )
+        
+        with transaction.atomic():
+            deleted, _ = TeamMembership.objects.filter(team=team, user_id=user_id).delete()
+            if not deleted:
+                return error_response(
+                    message='Member not found in this team',
+                    code=404,
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            # member_count 已由信号在数据库中更新，这里同步内存中的 team
+            team.member_count -= deleted
+            
+            # 如果移除的是 leader，用一条条件 UPDATE 清除团队的 leader
+            now = timezone.now()
+            if Team.objects.filter(pk=team.pk, leader_id=user_id).update(leader=None, updated_at=now):
+                team.leader = None
+                team.updated_at = now
+        
+        # 返回更新后的团队信息
+        team_serializer = TeamSerializer(team)
+        return success_response(
+            team_serializer.data,
+            message='Member removed successfully'
+        )
 
 
 # ===== Audit Log Views =====
 
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+class AuditLogViewSet(CursorPaginationMixin, viewsets.ReadOnlyModelViewSet):
     """
     Audit Log ViewSet (只读)
     
@@ -624,11 +692,13 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = AuditLog.objects.all()
     serializer_class = AuditLogSerializer
     permission_classes = [IsAdminOrManager]  # Changed from IsAdmin to allow Manager access
-    pagination_class = CustomPagination
+    pagination_class = EstimatedCountPagination
+    cursor_pagination_class = AuditLogCursorPagination
     
     def get_queryset(self):
         """支持过滤参数"""
-        queryset = super().get_queryset()
+        # AuditLogSerializer 读取 user.id，一并 JOIN 避免 N+1
+        queryset = super().get_queryset().select_related('user')
         
         # 按用户过滤
         user_id = self.request.query_params.get('userId')
@@ -669,7 +739,7 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
         return success_response(serializer.data)
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(CursorPaginationMixin, viewsets.ModelViewSet):
     """
     通知视图集
     
@@ -678,6 +748,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = CustomPagination
+    cursor_pagination_class = CustomCursorPagination
     
     def get_queryset(self):
         """返回当前用户的通知"""
@@ -686,7 +757,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         """
         获取当前用户的通知列表
-        支持查询参数: page, pageSize, isRead
+        支持查询参数: page, pageSize, isRead (传 cursor 则使用游标分页)
         """
         queryset = self.get_queryset()
         
@@ -717,38 +788,47 @@ class NotificationViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
-        """获取未读通知数量"""
-        count = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).count()
-        return success_response({'count': count})
+        """获取未读通知数量（读取用户表上的计数字段，无需 COUNT 查询）"""
+        return success_response({'count': request.user.unread_notification_count})
     
     @action(detail=True, methods=['post'])
     def mark_read(self, request, pk=None):
-        """标记单条通知为已读"""
-        notification = get_object_or_404(
-            Notification,
-            id=pk,
-            recipient=request.user
-        )
+        """
+        标记单条通知为已读
+        返回 {id, isRead, readAt}；UPDATE 命中时直接用刚写入的值，不再回查
+        """
+        if not str(pk).isdigit():
+            return error_response(
+                message='Notification not found',
+                code=404,
+                status_code=status.HTTP_404_NOT_FOUND
+            )
         
-        if not notification.is_read:
-            notification.is_read = True
-            notification.read_at = timezone.now()
-            notification.save()
+        # 条件 UPDATE（已读时为空操作），避免 SELECT 与 UPDATE 之间的竞态
+        read_at = timezone.now()
+        if Notification.mark_many_as_read(request.user, ids=[pk], read_at=read_at):
+            return success_response({'id': int(pk), 'isRead': True, 'readAt': read_at})
         
-        serializer = self.get_serializer(notification)
-        return success_response(serializer.data)
+        # 未命中：已读（返回原已读时间）或不存在
+        notification = Notification.objects.filter(
+            id=pk, recipient=request.user
+        ).values('id', 'read_at').first()
+        if notification is None:
+            return error_response(
+                message='Notification not found',
+                code=404,
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+        return success_response({
+            'id': notification['id'],
+            'isRead': True,
+            'readAt': notification['read_at']
+        })
     
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
         """标记所有通知为已读"""
-        now = timezone.now()
-        updated = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).update(is_read=True, read_at=now)
+        updated = Notification.mark_many_as_read(request.user)
         
         return success_response({
             'message': f'{updated} notifications marked as read',
@@ -12,11 +12,11 @@ class ApiJSONRenderer(CamelCaseJSONRenderer):
     def render(self, data, accepted_media_type=None, renderer_context=None):
         response = renderer_context.get("response") if renderer_context else None
 
-        # If data is already wrapped, keep it as-is
-        if isinstance(data, dict) and {"code", "message", "data"} <= set(data.keys()):
+        # If data is already wrapped, keep it as-is (three key probes, no set building)
+        if isinstance(data, dict) and "code" in data and "message" in data and "data" in data:
             wrapped = data
         else:
-            status_code = getattr(response, "status_code", 200) if response else 200
+            status_code = getattr(response, "status_code", 200)
             # Only wrap 2xx responses here; errors are handled by custom exception handler
             if 200 <= status_code < 300:
                 wrapped = {"code": 200, "message": "Success", "data": data}
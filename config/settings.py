@@ -201,7 +201,7 @@ REST_FRAMEWORK = {
         "djangorestframework_camel_case.parser.CamelCaseMultiPartParser",
     ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.LightweightJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -238,6 +238,13 @@ SPECTACULAR_SETTINGS = {
     'SECURITY': [{'BearerAuth': []}],
 }
 
+# ===== Cache =====
+# Per-process memory cache by default; point CACHE_URL at a shared backend
+# (e.g. redis://localhost:6379/1) when running several workers.
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
 # ===== Email Configuration =====
 # For development, use console backend (emails printed to console)
 EMAIL_BACKEND = env('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
@@ -249,3 +256,15 @@ EMAIL_USE_TLS = env.bool('EMAIL_USE_TLS', default=True)
 EMAIL_HOST_USER = env('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = env('DEFAULT_FROM_EMAIL', default='IT Support <noreply@itsupport.local>')
+
+# ===== Notification Delivery =====
+# Notification fan-out and emails run on a background thread pool after the
+# request transaction commits. Set NOTIFICATIONS_ASYNC=False to send inline.
+NOTIFICATIONS_ASYNC = env.bool('NOTIFICATIONS_ASYNC', default=True)
+NOTIFICATION_WORKERS = env.int('NOTIFICATION_WORKERS', default=4)
+# Further comments on the same ticket within this many seconds are batched
+# into one digest notification per recipient. Off by default (0): pending
+# digests live in the Django cache and are flushed by an in-process timer, so
+# enabling it requires a cache shared by all workers (not the default locmem)
+# and accepting that digests pending at a worker restart are dropped.
+NOTIFICATION_COMMENT_WINDOW = env.int('NOTIFICATION_COMMENT_WINDOW', default=0)
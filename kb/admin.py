@@ -1,4 +1,9 @@
 from django.contrib import admin
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from accounts.admin import is_changelist_request
+
 from .models import KnowledgeArticle, Tag
 
 
@@ -26,6 +31,7 @@ class KnowledgeArticleAdmin(admin.ModelAdmin):
         'created_at', 'updated_at', 'published_at', 'deleted_at'
     ]
     filter_horizontal = ['tags']
+    list_select_related = ['created_by']
     
     fieldsets = (
         ('Basic Information', {
@@ -45,6 +51,13 @@ class KnowledgeArticleAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            # The changelist (and its bulk actions) never needs the Markdown body
+            queryset = queryset.defer('content')
+        return queryset
+    
     def save_model(self, request, obj, form, change):
         """Set created_by and updated_by"""
         if not change:
@@ -55,22 +68,25 @@ class KnowledgeArticleAdmin(admin.ModelAdmin):
     actions = ['publish_articles', 'archive_articles', 'soft_delete_articles']
     
     def publish_articles(self, request, queryset):
-        """Bulk publish articles"""
-        for article in queryset:
-            article.publish()
-        self.message_user(request, f'{queryset.count()} articles published.')
+        """Bulk publish articles (single UPDATE; keeps an existing published_at)"""
+        now = timezone.now()
+        updated = queryset.update(
+            status='published',
+            published_at=Coalesce(F('published_at'), now),
+            updated_at=now,
+        )
+        self.message_user(request, f'{updated} articles published.')
     publish_articles.short_description = 'Publish selected articles'
     
     def archive_articles(self, request, queryset):
-        """Bulk archive articles"""
-        for article in queryset:
-            article.archive()
-        self.message_user(request, f'{queryset.count()} articles archived.')
+        """Bulk archive articles (single UPDATE)"""
+        updated = queryset.update(status='archived', updated_at=timezone.now())
+        self.message_user(request, f'{updated} articles archived.')
     archive_articles.short_description = 'Archive selected articles'
     
     def soft_delete_articles(self, request, queryset):
-        """Bulk soft delete articles"""
-        for article in queryset:
-            article.soft_delete()
-        self.message_user(request, f'{queryset.count()} articles deleted.')
+        """Bulk soft delete articles (single UPDATE)"""
+        now = timezone.now()
+        updated = queryset.update(deleted_at=now, updated_at=now)
+        self.message_user(request, f'{updated} articles deleted.')
     soft_delete_articles.short_description = 'Soft delete selected articles'
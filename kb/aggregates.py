@@ -0,0 +1,14 @@
+from django.db.models import Aggregate, JSONField
+
+
+class JSONGroupArray(Aggregate):
+    """
+    Collect grouped values into a JSON array column
+    SQLite: JSON_GROUP_ARRAY(...), PostgreSQL: JSONB_AGG(...)
+    """
+    function = 'JSON_GROUP_ARRAY'
+    output_field = JSONField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        # jsonb (not json) so the value reaches JSONField.from_db_value as a string
+        return super().as_sql(compiler, connection, function='JSONB_AGG', **extra_context)
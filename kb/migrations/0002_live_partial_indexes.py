@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kb', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='knowledgearticle',
+            name='kb_knowledg_is_faq_99abac_idx',
+        ),
+        migrations.AddIndex(
+            model_name='knowledgearticle',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['status', 'access_level', '-created_at'], name='kb_live_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='knowledgearticle',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_faq', True)), fields=['-created_at'], name='kb_live_faq_idx'),
+        ),
+    ]
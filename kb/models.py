@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F, Q
 from django.conf import settings
 from django.utils import timezone
 
@@ -83,39 +84,56 @@ class KnowledgeArticle(models.Model):
         indexes = [
             models.Index(fields=['status', 'access_level']),
             models.Index(fields=['category']),
-            models.Index(fields=['is_faq']),
             models.Index(fields=['deleted_at']),
+            # Partial indexes for the hot list queries; soft-deleted rows are not stored
+            models.Index(
+                fields=['status', 'access_level', '-created_at'],
+                name='kb_live_published_idx',
+                condition=Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['-created_at'],
+                name='kb_live_faq_idx',
+                condition=Q(is_faq=True, deleted_at__isnull=True),
+            ),
         ]
     
     def __str__(self):
         return self.title
     
-    def soft_delete(self):
+    def _save_changes(self, fields, updated_by=None):
+        """Save only the given columns (plus updated_at / updated_by)"""
+        fields = list(fields) + ['updated_at']
+        if updated_by is not None:
+            self.updated_by = updated_by
+            fields.append('updated_by')
+        self.save(update_fields=fields)
+    
+    def soft_delete(self, updated_by=None):
         """Soft delete the article"""
         self.deleted_at = timezone.now()
-        self.save()
+        self._save_changes(['deleted_at'], updated_by)
     
-    def publish(self):
+    def publish(self, updated_by=None):
         """Publish the article"""
         self.status = 'published'
         if not self.published_at:
             self.published_at = timezone.now()
-        self.save()
+        self._save_changes(['status', 'published_at'], updated_by)
     
-    def archive(self):
+    def archive(self, updated_by=None):
         """Archive the article"""
         self.status = 'archived'
-        self.save()
+        self._save_changes(['status'], updated_by)
     
     def increment_view_count(self):
-        """Increment view count"""
+        """Increment view count (atomic UPDATE, no read-modify-write)"""
+        type(self).objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
+        # Keep the in-memory value in step for the response serializer
         self.view_count += 1
-        self.save(update_fields=['view_count'])
     
     def add_feedback(self, helpful):
-        """Add feedback"""
-        if helpful:
-            self.helpful_count += 1
-        else:
-            self.not_helpful_count += 1
-        self.save(update_fields=['helpful_count', 'not_helpful_count'])
+        """Add feedback (atomic UPDATE on the chosen counter)"""
+        field = 'helpful_count' if helpful else 'not_helpful_count'
+        type(self).objects.filter(pk=self.pk).update(**{field: F(field) + 1})
+        setattr(self, field, getattr(self, field) + 1)
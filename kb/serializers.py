@@ -1,7 +1,18 @@
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
+
+from accounts.serializers_cache import CachedFieldsMixin
+
 from .models import KnowledgeArticle, Tag
 
 
+# Formats timestamps exactly like a declared DateTimeField. Kept at module level:
+# a Field declared on the serializer class would be moved into _declared_fields
+# by SerializerMetaclass and treated as an output field
+_datetime_field = serializers.DateTimeField()
+
+
 class TagSerializer(serializers.ModelSerializer):
     """Tag serializer"""
     class Meta:
@@ -9,7 +20,7 @@ class TagSerializer(serializers.ModelSerializer):
         fields = ['name']
 
 
-class KnowledgeArticleSerializer(serializers.ModelSerializer):
+class KnowledgeArticleSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Knowledge Article Serializer
     Outputs camelCase fields as required by frontend
@@ -47,13 +58,39 @@ class KnowledgeArticleSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = KnowledgeArticle
-        fields = [
+        fields = (
             'id', 'title', 'content', 'summary', 'category', 'tags',
             'status', 'accessLevel', 'isFAQ',
             'authorId', 'authorName',
             'viewCount', 'helpfulCount', 'notHelpfulCount',
             'createdAt', 'updatedAt', 'publishedAt'
-        ]
+        )
+    
+    def to_representation(self, instance):
+        """
+        Build the camelCase payload directly from the instance
+        (one dict per article instead of resolving every declared field's source)
+        """
+        to_datetime = _datetime_field.to_representation
+        return {
+            'id': instance.id,
+            'title': instance.title,
+            'content': instance.content,
+            'summary': instance.summary,
+            'category': instance.category,
+            'tags': self.get_tags(instance),
+            'status': instance.status,
+            'accessLevel': instance.access_level,
+            'isFAQ': instance.is_faq,
+            'authorId': instance.created_by_id,
+            'authorName': self.get_authorName(instance),
+            'viewCount': instance.view_count,
+            'helpfulCount': instance.helpful_count,
+            'notHelpfulCount': instance.not_helpful_count,
+            'createdAt': to_datetime(instance.created_at),
+            'updatedAt': to_datetime(instance.updated_at),
+            'publishedAt': to_datetime(instance.published_at) if instance.published_at else None,
+        }
     
     def get_authorName(self, obj):
         """Get author name"""
@@ -98,48 +135,51 @@ class KnowledgeArticleSerializer(serializers.ModelSerializer):
         return instance
     
     def _update_tags(self, article, tags_data):
-        """Update article tags"""
-        article.tags.clear()
-        for tag_name in tags_data:
-            tag, created = Tag.objects.get_or_create(name=tag_name.strip())
-            article.tags.add(tag)
-
-
-class KnowledgeArticleListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for list views"""
-    id = serializers.IntegerField(read_only=True)
-    authorId = serializers.IntegerField(source='created_by.id', read_only=True, allow_null=True)
-    authorName = serializers.SerializerMethodField()
-    tags = serializers.SerializerMethodField()
-    viewCount = serializers.IntegerField(source='view_count', read_only=True)
-    helpfulCount = serializers.IntegerField(source='helpful_count', read_only=True)
-    notHelpfulCount = serializers.IntegerField(source='not_helpful_count', read_only=True)
-    createdAt = serializers.DateTimeField(source='created_at', read_only=True)
-    updatedAt = serializers.DateTimeField(source='updated_at', read_only=True)
-    publishedAt = serializers.DateTimeField(source='published_at', read_only=True, allow_null=True)
-    accessLevel = serializers.CharField(source='access_level', read_only=True)
-    isFAQ = serializers.BooleanField(source='is_faq', read_only=True)
-    
-    class Meta:
-        model = KnowledgeArticle
-        fields = [
-            'id', 'title', 'summary', 'category', 'tags',
-            'status', 'accessLevel', 'isFAQ',
-            'authorId', 'authorName',
-            'viewCount', 'helpfulCount', 'notHelpfulCount',
-            'createdAt', 'updatedAt', 'publishedAt'
-        ]
-    
-    def get_authorName(self, obj):
-        """Get author name"""
-        if obj.created_by:
-            full_name = f"{obj.created_by.first_name} {obj.created_by.last_name}".strip()
-            return full_name if full_name else obj.created_by.username
-        return None
+        """
+        Update article tags (a fixed number of queries regardless of tag count)
+        Touches updated_at so the cached article detail is rebuilt with the new tags
+        """
+        names = {tag_name.strip() for tag_name in tags_data}
+        with transaction.atomic():
+            existing = set(Tag.objects.filter(name__in=names).values_list('name', flat=True))
+            Tag.objects.bulk_create(
+                [Tag(name=name) for name in names - existing],
+                ignore_conflicts=True
+            )
+            article.tags.set(Tag.objects.filter(name__in=names))
+            article.updated_at = timezone.now()
+            KnowledgeArticle.objects.filter(pk=article.pk).update(updated_at=article.updated_at)
+
+
+class KnowledgeArticleListSerializer(serializers.Serializer):
+    """
+    Lightweight serializer for list views
+    Reads the row dicts built by kb.views.list_article_rows (tag names sorted by name);
+    the documented item shape is KnowledgeArticleListItemSerializer
+    """
     
-    def get_tags(self, obj):
-        """Return tags as array of strings"""
-        return [tag.name for tag in obj.tags.all()]
+    def to_representation(self, row):
+        """Build the camelCase payload straight from the row dict"""
+        to_datetime = _datetime_field.to_representation
+        published_at = row['published_at']
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'summary': row['summary'],
+            'category': row['category'],
+            'tags': sorted(row['tag_names']),
+            'status': row['status'],
+            'accessLevel': row['access_level'],
+            'isFAQ': row['is_faq'],
+            'authorId': row['created_by_id'],
+            'authorName': row['author_name'],
+            'viewCount': row['view_count'],
+            'helpfulCount': row['helpful_count'],
+            'notHelpfulCount': row['not_helpful_count'],
+            'createdAt': to_datetime(row['created_at']),
+            'updatedAt': to_datetime(row['updated_at']),
+            'publishedAt': to_datetime(published_at) if published_at else None,
+        }
 
 
 class FeedbackSerializer(serializers.Serializer):
@@ -168,9 +208,29 @@ class SuggestionsQuerySerializer(serializers.Serializer):
     limit = serializers.IntegerField(required=False, default=5)
 
 
+class KnowledgeArticleListItemSerializer(serializers.Serializer):
+    """Knowledge article list item, as built by KnowledgeArticleListSerializer (Swagger only)"""
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    summary = serializers.CharField(allow_null=True)
+    category = serializers.CharField()
+    tags = serializers.ListField(child=serializers.CharField())
+    status = serializers.CharField()
+    accessLevel = serializers.CharField()
+    isFAQ = serializers.BooleanField()
+    authorId = serializers.IntegerField(allow_null=True)
+    authorName = serializers.CharField(allow_null=True)
+    viewCount = serializers.IntegerField()
+    helpfulCount = serializers.IntegerField()
+    notHelpfulCount = serializers.IntegerField()
+    createdAt = serializers.DateTimeField()
+    updatedAt = serializers.DateTimeField()
+    publishedAt = serializers.DateTimeField(allow_null=True)
+
+
 class PaginatedKnowledgeArticleListResponseSerializer(serializers.Serializer):
     """Paginated response for knowledge article list (Swagger only)"""
-    items = KnowledgeArticleListSerializer(many=True)
+    items = KnowledgeArticleListItemSerializer(many=True)
     page = serializers.IntegerField()
     pageSize = serializers.IntegerField()
     total = serializers.IntegerField()
@@ -1,4 +1,5 @@
-from django.db.models import Q
+from django.db.models import JSONField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.permissions import IsAuthenticated
@@ -6,14 +7,17 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSet
 from django.utils import timezone
+from django.core.cache import cache
 from django.core.paginator import Paginator
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
+from .aggregates import JSONGroupArray
 from .models import KnowledgeArticle, Tag
 from .serializers import (
     KnowledgeArticleSerializer,
     KnowledgeArticleListSerializer,
+    KnowledgeArticleListItemSerializer,
     FeedbackSerializer,
     PaginatedKnowledgeArticleListResponseSerializer,
     MessageResponseSerializer,
@@ -52,6 +56,71 @@ def get_visible_articles_queryset(user):
         )
 
 
+# Columns read by KnowledgeArticleListSerializer (the Markdown content is never listed)
+ARTICLE_LIST_VALUES = (
+    'id', 'title', 'summary', 'category', 'status', 'access_level', 'is_faq',
+    'view_count', 'helpful_count', 'not_helpful_count',
+    'created_at', 'updated_at', 'published_at', 'created_by_id',
+    'author_name', 'tag_names',
+)
+
+
+def list_article_rows(queryset):
+    """
+    Turn an article queryset into plain row dicts for KnowledgeArticleListSerializer:
+    author name and tag names are computed in SQL and no model instances are built,
+    so list endpoints run a fixed number of queries regardless of page size
+    """
+    # Tag names arrive as one JSON array column per article (correlated subquery,
+    # so a tags__name filter on the outer query does not narrow the list)
+    tag_names = (
+        Tag.objects.filter(articles=OuterRef('pk'))
+        .order_by()
+        .values('articles')
+        .annotate(names=JSONGroupArray('name'))
+        .values('names')
+    )
+    # Author display name: "first last", falling back to username (NULL without author)
+    author_name = Coalesce(
+        NullIf(
+            Trim(Concat('created_by__first_name', Value(' '), 'created_by__last_name')),
+            Value(''),
+        ),
+        'created_by__username',
+    )
+    return queryset.annotate(
+        tag_names=Coalesce(Subquery(tag_names), Value('[]'), output_field=JSONField()),
+        author_name=author_name,
+    ).values(*ARTICLE_LIST_VALUES)
+
+
+ARTICLE_CACHE_TIMEOUT = 3600
+
+
+def get_article_payload(article):
+    """
+    Serialized article detail, cached per (id, updated_at, author updated_at)
+    Any save or tag change bumps the article's updated_at and renaming the author
+    bumps theirs, so edits invalidate the entry without signal wiring
+    """
+    author = article.created_by
+    author_version = author.updated_at.timestamp() if author else ''
+    key = f'kb:art:{article.pk}:{article.updated_at.timestamp()}:{author_version}'
+    data = cache.get_or_set(
+        key,
+        lambda: dict(KnowledgeArticleSerializer(article).data),
+        ARTICLE_CACHE_TIMEOUT
+    )
+    # Counters are bumped with F() updates that leave updated_at alone,
+    # so they always come from the freshly loaded row
+    return {
+        **data,
+        'viewCount': article.view_count,
+        'helpfulCount': article.helpful_count,
+        'notHelpfulCount': article.not_helpful_count,
+    }
+
+
 @extend_schema_view(
     list=extend_schema(
         parameters=[
@@ -117,6 +186,7 @@ def get_visible_articles_queryset(user):
 class KnowledgeArticleViewSet(ViewSet):
     """Knowledge Article ViewSet"""
     permission_classes = [IsAuthenticated]
+    lookup_value_regex = r'\d+'
     
     def list(self, request):
         """
@@ -161,7 +231,7 @@ class KnowledgeArticleViewSet(ViewSet):
         page = int(request.query_params.get('page', 1))
         page_size = int(request.query_params.get('pageSize', 10))
         
-        paginator = Paginator(queryset, page_size)
+        paginator = Paginator(list_article_rows(queryset), page_size)
         page_obj = paginator.get_page(page)
         
         # Serialize
@@ -176,6 +246,7 @@ class KnowledgeArticleViewSet(ViewSet):
             'totalPages': paginator.num_pages
         })
     
+    @action(detail=False, methods=['get'], url_path='all', url_name='list-all')
     def list_all(self, request):
         """
         GET /api/knowledge/articles/all
@@ -220,7 +291,7 @@ class KnowledgeArticleViewSet(ViewSet):
         page = int(request.query_params.get('page', 1))
         page_size = int(request.query_params.get('pageSize', 10))
         
-        paginator = Paginator(queryset, page_size)
+        paginator = Paginator(list_article_rows(queryset), page_size)
         page_obj = paginator.get_page(page)
         
         serializer = KnowledgeArticleListSerializer(page_obj.object_list, many=True)
@@ -239,7 +310,9 @@ class KnowledgeArticleViewSet(ViewSet):
         Get article detail and increment view count
         """
         try:
-            article = KnowledgeArticle.objects.get(pk=pk, deleted_at__isnull=True)
+            article = KnowledgeArticle.objects.select_related('created_by').get(
+                pk=pk, deleted_at__isnull=True
+            )
         except KnowledgeArticle.DoesNotExist:
             return Response(
                 {'detail': 'Article not found.'},
@@ -257,8 +330,7 @@ class KnowledgeArticleViewSet(ViewSet):
         # Increment view count
         article.increment_view_count()
         
-        serializer = KnowledgeArticleSerializer(article)
-        return Response(serializer.data)
+        return Response(get_article_payload(article))
     
     def create(self, request):
         """
@@ -357,6 +429,7 @@ class KnowledgeArticleViewSet(ViewSet):
         
         return Response({'deleted': True}, status=status.HTTP_200_OK)
     
+    @action(detail=True, methods=['post'])
     def publish(self, request, pk=None):
         """
         POST /api/knowledge/articles/:id/publish
@@ -376,13 +449,12 @@ class KnowledgeArticleViewSet(ViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        article.publish()
-        article.updated_by = request.user
-        article.save()
+        article.publish(updated_by=request.user)
         
         serializer = KnowledgeArticleSerializer(article)
         return Response(serializer.data)
     
+    @action(detail=True, methods=['post'])
     def archive(self, request, pk=None):
         """
         POST /api/knowledge/articles/:id/archive
@@ -402,9 +474,7 @@ class KnowledgeArticleViewSet(ViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        article.archive()
-        article.updated_by = request.user
-        article.save()
+        article.archive(updated_by=request.user)
         
         serializer = KnowledgeArticleSerializer(article)
         return Response(serializer.data)
@@ -415,13 +485,18 @@ class KnowledgeArticleViewSet(ViewSet):
         operation_id='kb_articles_feedback',
         summary='Submit article feedback'
     )
+    @action(detail=True, methods=['post'])
     def feedback(self, request, pk=None):
         """
         POST /api/knowledge/articles/:id/feedback
         Submit feedback (all authenticated users)
         """
         try:
-            article = KnowledgeArticle.objects.get(pk=pk, deleted_at__isnull=True)
+            # Only the visibility columns and counters; the counter itself is
+            # bumped with an atomic UPDATE in add_feedback()
+            article = KnowledgeArticle.objects.only(
+                'id', 'status', 'access_level', 'helpful_count', 'not_helpful_count'
+            ).get(pk=pk, deleted_at__isnull=True)
         except KnowledgeArticle.DoesNotExist:
             return Response(
                 {'detail': 'Article not found.'},
@@ -441,13 +516,17 @@ class KnowledgeArticleViewSet(ViewSet):
             helpful = serializer.validated_data['helpful']
             article.add_feedback(helpful)
             
-            return Response({'message': 'Feedback submitted successfully.'})
+            return Response({
+                'message': 'Feedback submitted successfully.',
+                'helpfulCount': article.helpful_count,
+                'notHelpfulCount': article.not_helpful_count
+            })
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @extend_schema(
-    responses={200: KnowledgeArticleListSerializer(many=True)},
+    responses={200: KnowledgeArticleListItemSerializer(many=True)},
     operation_id='kb_faq_list',
     summary='List FAQ articles'
 )
@@ -459,7 +538,7 @@ def faq_list(request):
     Get FAQ articles (visible to current user)
     """
     queryset = get_visible_articles_queryset(request.user).filter(is_faq=True)
-    queryset = queryset.order_by('-created_at')
+    queryset = list_article_rows(queryset.order_by('-created_at'))
     
     serializer = KnowledgeArticleListSerializer(queryset, many=True)
     return Response(serializer.data)
@@ -470,7 +549,7 @@ def faq_list(request):
         OpenApiParameter(name='query', type=OpenApiTypes.STR, required=False, description='Search query'),
         OpenApiParameter(name='limit', type=OpenApiTypes.INT, required=False, description='Result limit'),
     ],
-    responses={200: KnowledgeArticleListSerializer(many=True)},
+    responses={200: KnowledgeArticleListItemSerializer(many=True)},
     operation_id='kb_suggestions',
     summary='Get article search suggestions'
 )
@@ -492,7 +571,8 @@ def suggestions(request):
         Q(title__icontains=query) |
         Q(content__icontains=query) |
         Q(summary__icontains=query)
-    ).order_by('-view_count', '-created_at')[:limit]
+    ).order_by('-view_count', '-created_at')
+    queryset = list_article_rows(queryset)[:limit]
     
     serializer = KnowledgeArticleListSerializer(queryset, many=True)
     return Response(serializer.data)
@@ -511,12 +591,16 @@ def categories_list(request):
     Get all categories from visible articles
     """
     queryset = get_visible_articles_queryset(request.user)
-    categories = queryset.values_list('category', flat=True).distinct().order_by('category')
     
-    # Filter out empty categories
-    categories = [cat for cat in categories if cat]
+    # Filter out empty categories in the same DISTINCT query
+    categories = (
+        queryset.exclude(category='')
+        .values_list('category', flat=True)
+        .distinct()
+        .order_by('category')
+    )
     
-    return Response(categories)
+    return Response(list(categories))
 
 
 @extend_schema(
@@ -308,7 +308,10 @@ class TicketStatusChangeView(GenericAPIView):
     serializer_class = TicketStatusChangeSerializer
 
     def post(self, request, ticket_id):
-        ticket = get_object_or_404(Ticket, id=ticket_id)
+        # category is nested by the TicketDetailSerializer response below; the
+        # status-change notification reads no relation (requester_id / assignee_id
+        # are plain string ids resolved in one batched user query)
+        ticket = get_object_or_404(Ticket.objects.select_related("category"), id=ticket_id)
 
         ser = self.get_serializer(data=request.data)
         ser.is_valid(raise_exception=True)